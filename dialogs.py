@@ -27,7 +27,10 @@
 
 ############ Imports ############
 
+import functools
+import operator
 import os
+from pathlib import Path
 
 from PyQt5 import QtCore, QtGui, QtWidgets
 Qt = QtCore.Qt
@@ -36,14 +39,74 @@ from bytes import bytes_to_string, to_bytes
 import globals
 from items import ZoneItem
 from misc import HexSpinBox, BGName, setting
+import spritelib as SLib
 from strings import MiyamotoTranslation
-from ui import MiyamotoTheme, toQColor, GetIcon, createHorzLine
+from ui import MiyamotoTheme, GetIcon, createHorzLine
 from widgets import LoadingTab, TilesetsTab
 from verifications import SetDirty
 
+if globals.cython_available:
+    from zonesnap_cy import SnapZoneToGrid
+else:
+    from zonesnap import SnapZoneToGrid
+
 #################################
 
 
+@functools.lru_cache(maxsize=4096)
+def _trCached(trans, *args):
+    return trans.string(*args)
+
+
+def _tr(*args):
+    """
+    Cached version of globals.trans.string(), for strings that are looked up repeatedly
+    """
+    return _trCached(globals.trans, *args)
+
+
+def _zoneTabName(num):
+    """
+    Returns the long-form label of the zone tab with the given number
+    """
+    return _tr('ZonesDlg', 3, '[num]', num)
+
+
+# Zone attributes that get copied when cloning a zone
+_zoneCloneAttrs = operator.attrgetter(
+    'objx', 'objy', 'width', 'height', 'modeldark', 'terraindark',
+    'cammode', 'camzoom', 'unk1', 'visibility', 'unk2', 'camtrack', 'unk3', 'music', 'sfxmod', 'type',
+)
+_zoneCloneBounds = operator.attrgetter(
+    'yupperbound', 'ylowerbound', 'yupperbound2', 'ylowerbound2',
+    'entryid', 'mpcamzoomadjust', 'yupperbound3', 'ylowerbound3',
+)
+
+
+@functools.lru_cache(maxsize=1)
+def _styleKeys():
+    """
+    Returns the names of the available Qt styles, which can't change while running
+    """
+    return tuple(QtWidgets.QStyleFactory.keys())
+
+
+@functools.lru_cache(maxsize=1)
+def _readmeText():
+    """
+    Returns the contents of readme.md, reading it only once per session
+    """
+    return Path('readme.md').read_text(encoding='utf-8')
+
+
+@functools.lru_cache(maxsize=1)
+def _aboutPixmap():
+    """
+    Returns the About dialog logo, loading it only once per session
+    """
+    return QtGui.QPixmap('miyamotodata/about.png')
+
+
 class InputBox(QtWidgets.QDialog):
     Type_TextBox = 1
     Type_SpinBox = 2
@@ -76,6 +139,19 @@ class InputBox(QtWidgets.QDialog):
         self.setLayout(self.layout)
 
 
+# Description shown in the About dialog
+AboutDescription = (
+    '<html><head><style type=\'text/CSS\'>'
+    'body {font-family: Calibri}'
+    '.main {font-size: 12px}'
+    '</style></head><body>'
+    '<center><h1><i>Miyamoto!</i> Level Editor</h1><div class=\'main\'>'
+    '<i>Miyamoto! Level Editor</i> is a fork of Reggie! Level Editor, an open-source global project started by Treeki in 2010 that aimed to bring New Super Mario Bros. Wii&trade; levels. Now in later years, brings you New Super Mario Bros. U&trade;!<br>'
+    'Interested? Check out <a href=\'https://github.com/aboood40091/Miyamoto\'>the Github repository</a> for updates and related downloads, or <a href=\'https://discord.gg/AvFEHpp\'>our Discord group</a> to get in touch with the developers.<br>'
+    '</div></center></body></html>'
+)
+
+
 class AboutDialog(QtWidgets.QDialog):
     """
     The About info for Miyamoto
@@ -89,38 +165,22 @@ class AboutDialog(QtWidgets.QDialog):
         self.setWindowTitle(globals.trans.string('AboutDlg', 0))
         self.setWindowIcon(GetIcon('help'))
 
-        # Open the readme file
-        f = open('readme.md', 'r')
-        readme = f.read()
-        f.close()
-        del f
-
         # Logo
-        logo = QtGui.QPixmap('miyamotodata/about.png')
+        logo = _aboutPixmap()
         logoLabel = QtWidgets.QLabel()
         logoLabel.setPixmap(logo)
         logoLabel.setContentsMargins(16, 4, 32, 4)
 
-        # Description
-        description = '<html><head><style type=\'text/CSS\'>'
-        description += 'body {font-family: Calibri}'
-        description += '.main {font-size: 12px}'
-        description += '</style></head><body>'
-        description += '<center><h1><i>Miyamoto!</i> Level Editor</h1><div class=\'main\'>'
-        description += '<i>Miyamoto! Level Editor</i> is a fork of Reggie! Level Editor, an open-source global project started by Treeki in 2010 that aimed to bring New Super Mario Bros. Wii&trade; levels. Now in later years, brings you New Super Mario Bros. U&trade;!<br>'
-        description += 'Interested? Check out <a href=\'https://github.com/aboood40091/Miyamoto\'>the Github repository</a> for updates and related downloads, or <a href=\'https://discord.gg/AvFEHpp\'>our Discord group</a> to get in touch with the developers.<br>'
-        description += '</div></center></body></html>'
-
         # Description label
         descLabel = QtWidgets.QLabel()
-        descLabel.setText(description)
+        descLabel.setText(AboutDescription)
         descLabel.setMinimumWidth(512)
         descLabel.setWordWrap(True)
 
-        # Readme.md viewer
-        readmeView = QtWidgets.QPlainTextEdit()
-        readmeView.setPlainText(readme)
-        readmeView.setReadOnly(True)
+        # Readme.md viewer, filled in when the dialog is first shown
+        self.readmeView = QtWidgets.QPlainTextEdit()
+        self.readmeView.setReadOnly(True)
+        self.readmeLoaded = False
 
         # Buttonbox
         buttonBox = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok)
@@ -130,12 +190,22 @@ class AboutDialog(QtWidgets.QDialog):
         L = QtWidgets.QGridLayout()
         L.addWidget(logoLabel, 0, 0, 2, 1)
         L.addWidget(descLabel, 0, 1)
-        L.addWidget(readmeView, 1, 1)
+        L.addWidget(self.readmeView, 1, 1)
         L.addWidget(buttonBox, 2, 0, 1, 2)
         L.setRowStretch(1, 1)
         L.setColumnStretch(1, 1)
         self.setLayout(L)
 
+    def showEvent(self, event):
+        """
+        Loads the readme into the viewer the first time the dialog is shown
+        """
+        if not self.readmeLoaded:
+            self.readmeView.setPlainText(_readmeText())
+            self.readmeLoaded = True
+
+        super().showEvent(event)
+
 
 class ObjectShiftDialog(QtWidgets.QDialog):
     """
@@ -147,7 +217,7 @@ class ObjectShiftDialog(QtWidgets.QDialog):
         Creates and initializes the dialog
         """
         super().__init__()
-        self.setWindowTitle(globals.trans.string('ShftItmDlg', 0))
+        self.setWindowTitle(_tr('ShftItmDlg', 0))
         self.setWindowIcon(GetIcon('move'))
 
         self.XOffset = QtWidgets.QSpinBox()
@@ -161,13 +231,13 @@ class ObjectShiftDialog(QtWidgets.QDialog):
         buttonBox.rejected.connect(self.reject)
 
         moveLayout = QtWidgets.QFormLayout()
-        offsetlabel = QtWidgets.QLabel(globals.trans.string('ShftItmDlg', 2))
+        offsetlabel = QtWidgets.QLabel(_tr('ShftItmDlg', 2))
         offsetlabel.setWordWrap(True)
         moveLayout.addWidget(offsetlabel)
-        moveLayout.addRow(globals.trans.string('ShftItmDlg', 3), self.XOffset)
-        moveLayout.addRow(globals.trans.string('ShftItmDlg', 4), self.YOffset)
+        moveLayout.addRow(_tr('ShftItmDlg', 3), self.XOffset)
+        moveLayout.addRow(_tr('ShftItmDlg', 4), self.YOffset)
 
-        moveGroupBox = QtWidgets.QGroupBox(globals.trans.string('ShftItmDlg', 1))
+        moveGroupBox = QtWidgets.QGroupBox(_tr('ShftItmDlg', 1))
         moveGroupBox.setLayout(moveLayout)
 
         mainLayout = QtWidgets.QVBoxLayout()
@@ -283,15 +353,16 @@ class MetaInfoDialog(QtWidgets.QDialog):
         Creates and initializes the dialog
         """
         super().__init__()
-        self.setWindowTitle(globals.trans.string('InfoDlg', 0))
+        self.setWindowTitle(_tr('InfoDlg', 0))
         self.setWindowIcon(GetIcon('info'))
 
-        title = globals.Area.Metadata.strData('Title')
-        author = globals.Area.Metadata.strData('Author')
-        group = globals.Area.Metadata.strData('Group')
-        website = globals.Area.Metadata.strData('Website')
-        creator = globals.Area.Metadata.strData('Creator')
-        password = globals.Area.Metadata.strData('Password')
+        metadata = globals.Area.Metadata
+        title = metadata.strData('Title')
+        author = metadata.strData('Author')
+        group = metadata.strData('Group')
+        website = metadata.strData('Website')
+        creator = metadata.strData('Creator')
+        password = metadata.strData('Password')
         if title is None: title = '-'
         if author is None: author = '-'
         if group is None: group = '-'
@@ -299,6 +370,9 @@ class MetaInfoDialog(QtWidgets.QDialog):
         if creator is None: creator = '(unknown)'
         if password is None: password = ''
 
+        # Keep the password around so PasswordEntry doesn't have to query it on every keystroke
+        self.password = password
+
         self.levelName = QtWidgets.QLineEdit()
         self.levelName.setMaxLength(128)
         self.levelName.setReadOnly(True)
@@ -328,14 +402,7 @@ class MetaInfoDialog(QtWidgets.QDialog):
         self.Password.textChanged.connect(self.PasswordEntry)
         self.Password.setMinimumWidth(320)
 
-        self.changepw = QtWidgets.QPushButton(globals.trans.string('InfoDlg', 1))
-
-        if password != '':
-            self.levelName.setReadOnly(False)
-            self.Author.setReadOnly(False)
-            self.Group.setReadOnly(False)
-            self.Website.setReadOnly(False)
-            self.changepw.setDisabled(False)
+        self.changepw = QtWidgets.QPushButton(_tr('InfoDlg', 1))
 
         buttonBox = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
         buttonBox.addButton(self.changepw, buttonBox.ActionRole)
@@ -343,16 +410,17 @@ class MetaInfoDialog(QtWidgets.QDialog):
         buttonBox.rejected.connect(self.reject)
         self.changepw.clicked.connect(self.ChangeButton)
         self.changepw.setDisabled(True)
+        self.unlocked = None
 
-        self.lockedLabel = QtWidgets.QLabel(globals.trans.string('InfoDlg', 2))
+        self.lockedLabel = QtWidgets.QLabel(_tr('InfoDlg', 2))
 
         infoLayout = QtWidgets.QFormLayout()
         infoLayout.addWidget(self.lockedLabel)
-        infoLayout.addRow(globals.trans.string('InfoDlg', 3), self.Password)
-        infoLayout.addRow(globals.trans.string('InfoDlg', 4), self.levelName)
-        infoLayout.addRow(globals.trans.string('InfoDlg', 5), self.Author)
-        infoLayout.addRow(globals.trans.string('InfoDlg', 6), self.Group)
-        infoLayout.addRow(globals.trans.string('InfoDlg', 7), self.Website)
+        infoLayout.addRow(_tr('InfoDlg', 3), self.Password)
+        infoLayout.addRow(_tr('InfoDlg', 4), self.levelName)
+        infoLayout.addRow(_tr('InfoDlg', 5), self.Author)
+        infoLayout.addRow(_tr('InfoDlg', 6), self.Group)
+        infoLayout.addRow(_tr('InfoDlg', 7), self.Website)
 
         self.PasswordLabel = infoLayout.labelForField(self.Password)
 
@@ -361,7 +429,7 @@ class MetaInfoDialog(QtWidgets.QDialog):
         self.PasswordLabel.setVisible(levelIsLocked)
         self.Password.setVisible(levelIsLocked)
 
-        infoGroupBox = QtWidgets.QGroupBox(globals.trans.string('InfoDlg', 8, '[name]', creator))
+        infoGroupBox = QtWidgets.QGroupBox(_tr('InfoDlg', 8, '[name]', creator))
         infoGroupBox.setLayout(infoLayout)
 
         mainLayout = QtWidgets.QVBoxLayout()
@@ -371,21 +439,24 @@ class MetaInfoDialog(QtWidgets.QDialog):
 
         self.PasswordEntry('')
 
+    def setUnlocked(self, unlocked):
+        """
+        Makes the info fields editable or read-only, skipping the update if nothing changed
+        """
+        if unlocked == self.unlocked:
+            return
+
+        self.unlocked = unlocked
+        locked = not unlocked
+
+        self.levelName.setReadOnly(locked)
+        self.Author.setReadOnly(locked)
+        self.Group.setReadOnly(locked)
+        self.Website.setReadOnly(locked)
+        self.changepw.setDisabled(locked)
+
     def PasswordEntry(self, text):
-        pswd = globals.Area.Metadata.strData('Password')
-        if pswd is None: pswd = ''
-        if text == pswd:
-            self.levelName.setReadOnly(False)
-            self.Author.setReadOnly(False)
-            self.Group.setReadOnly(False)
-            self.Website.setReadOnly(False)
-            self.changepw.setDisabled(False)
-        else:
-            self.levelName.setReadOnly(True)
-            self.Author.setReadOnly(True)
-            self.Group.setReadOnly(True)
-            self.Website.setReadOnly(True)
-            self.changepw.setDisabled(True)
+        self.setUnlocked(text == self.password)
 
     # To all would be crackers who are smart enough to reach here:
     #
@@ -401,72 +472,69 @@ class MetaInfoDialog(QtWidgets.QDialog):
         """
         Allows the changing of a given password
         """
+        dlg = ChangePWDialog()
+        if dlg.exec_() == QtWidgets.QDialog.Accepted:
+            self.lockedLabel.setVisible(True)
+            self.Password.setVisible(True)
+            self.PasswordLabel.setVisible(True)
+            pswd = str(dlg.Verify.text())
+            globals.Area.Metadata.setStrData('Password', pswd)
+            self.password = pswd
+            self.Password.setText(pswd)
+            SetDirty()
 
-        class ChangePWDialog(QtWidgets.QDialog):
-            """
-            Dialog
-            """
+            self.setUnlocked(True)
 
-            def __init__(self):
-                super().__init__()
-                self.setWindowTitle(globals.trans.string('InfoDlg', 9))
-                self.setWindowIcon(GetIcon('info'))
 
-                self.New = QtWidgets.QLineEdit()
-                self.New.setMaxLength(64)
-                self.New.textChanged.connect(self.PasswordMatch)
-                self.New.setMinimumWidth(320)
+class ChangePWDialog(QtWidgets.QDialog):
+    """
+    Dialog which lets you change the password of the level
+    """
 
-                self.Verify = QtWidgets.QLineEdit()
-                self.Verify.setMaxLength(64)
-                self.Verify.textChanged.connect(self.PasswordMatch)
-                self.Verify.setMinimumWidth(320)
+    def __init__(self):
+        super().__init__()
+        self.setWindowTitle(_tr('InfoDlg', 9))
+        self.setWindowIcon(GetIcon('info'))
 
-                self.Ok = QtWidgets.QPushButton('OK')
-                self.Cancel = QtWidgets.QDialogButtonBox.Cancel
+        self.New = QtWidgets.QLineEdit()
+        self.New.setMaxLength(64)
+        self.New.textChanged.connect(self.PasswordMatch)
+        self.New.setMinimumWidth(320)
 
-                buttonBox = QtWidgets.QDialogButtonBox()
-                buttonBox.addButton(self.Ok, buttonBox.AcceptRole)
-                buttonBox.addButton(self.Cancel)
+        self.Verify = QtWidgets.QLineEdit()
+        self.Verify.setMaxLength(64)
+        self.Verify.textChanged.connect(self.PasswordMatch)
+        self.Verify.setMinimumWidth(320)
 
-                buttonBox.accepted.connect(self.accept)
-                buttonBox.rejected.connect(self.reject)
-                self.Ok.setDisabled(True)
+        self.Ok = QtWidgets.QPushButton('OK')
+        self.Cancel = QtWidgets.QDialogButtonBox.Cancel
 
-                infoLayout = QtWidgets.QFormLayout()
-                infoLayout.addRow(globals.trans.string('InfoDlg', 10), self.New)
-                infoLayout.addRow(globals.trans.string('InfoDlg', 11), self.Verify)
+        buttonBox = QtWidgets.QDialogButtonBox()
+        buttonBox.addButton(self.Ok, buttonBox.AcceptRole)
+        buttonBox.addButton(self.Cancel)
 
-                infoGroupBox = QtWidgets.QGroupBox(globals.trans.string('InfoDlg', 12))
+        buttonBox.accepted.connect(self.accept)
+        buttonBox.rejected.connect(self.reject)
+        self.Ok.setDisabled(True)
 
-                infoLabel = QtWidgets.QVBoxLayout()
-                infoLabel.addWidget(QtWidgets.QLabel(globals.trans.string('InfoDlg', 13)), 0, Qt.AlignCenter)
-                infoLabel.addLayout(infoLayout)
-                infoGroupBox.setLayout(infoLabel)
+        infoLayout = QtWidgets.QFormLayout()
+        infoLayout.addRow(_tr('InfoDlg', 10), self.New)
+        infoLayout.addRow(_tr('InfoDlg', 11), self.Verify)
 
-                mainLayout = QtWidgets.QVBoxLayout()
-                mainLayout.addWidget(infoGroupBox)
-                mainLayout.addWidget(buttonBox)
-                self.setLayout(mainLayout)
+        infoGroupBox = QtWidgets.QGroupBox(_tr('InfoDlg', 12))
 
-            def PasswordMatch(self, text):
-                self.Ok.setDisabled(self.New.text() != self.Verify.text() and self.New.text() != '')
+        infoLabel = QtWidgets.QVBoxLayout()
+        infoLabel.addWidget(QtWidgets.QLabel(_tr('InfoDlg', 13)), 0, Qt.AlignCenter)
+        infoLabel.addLayout(infoLayout)
+        infoGroupBox.setLayout(infoLabel)
 
-        dlg = ChangePWDialog()
-        if dlg.exec_() == QtWidgets.QDialog.Accepted:
-            self.lockedLabel.setVisible(True)
-            self.Password.setVisible(True)
-            self.PasswordLabel.setVisible(True)
-            pswd = str(dlg.Verify.text())
-            globals.Area.Metadata.setStrData('Password', pswd)
-            self.Password.setText(pswd)
-            SetDirty()
+        mainLayout = QtWidgets.QVBoxLayout()
+        mainLayout.addWidget(infoGroupBox)
+        mainLayout.addWidget(buttonBox)
+        self.setLayout(mainLayout)
 
-            self.levelName.setReadOnly(False)
-            self.Author.setReadOnly(False)
-            self.Group.setReadOnly(False)
-            self.Website.setReadOnly(False)
-            self.changepw.setDisabled(False)
+    def PasswordMatch(self, text):
+        self.Ok.setDisabled(self.New.text() != self.Verify.text() and self.New.text() != '')
 
 
 class AreaOptionsDialog(QtWidgets.QDialog):
@@ -516,20 +584,24 @@ class ZonesDialog(QtWidgets.QDialog):
             if widget:
                 self.setWidget(widget)
 
+                sizeHint = widget.sizeHint()
                 if initialWidth == -1:
-                    initialWidth = widget.sizeHint().width()
+                    initialWidth = sizeHint.width()
 
                 if initialHeight == -1:
-                    initialHeight = widget.sizeHint().height()
+                    initialHeight = sizeHint.height()
+
+            if initialWidth == -1 or initialHeight == -1:
+                sizeHint = super().sizeHint()
 
             if initialWidth == -1:
-                initialWidth = super().sizeHint().width()
+                initialWidth = sizeHint.width()
 
             else:
                 initialWidth += deltaWidth
 
             if initialHeight == -1:
-                initialHeight = super().sizeHint().height()
+                initialHeight = sizeHint.height()
 
             else:
                 initialHeight += deltaWidth
@@ -550,28 +622,20 @@ class ZonesDialog(QtWidgets.QDialog):
 
         self.tabWidget = QtWidgets.QTabWidget()
 
+        # Long tab labels, only used while there are 5 zones or less
+        self.longTabNames = tuple(_zoneTabName(i + 1) for i in range(5))
+
         self.zoneTabs = []
         self.BGTabs = []
-        for i, z in enumerate(globals.Area.zones):
-            ZoneTabName = globals.trans.string('ZonesDlg', 3, '[num]', i + 1)
-            tab = ZoneTab(z); tab.adjustSize()
-            self.zoneTabs.append(tab)
+        self.tabWidget.setUpdatesEnabled(False)
+        for z in globals.Area.zones:
+            self.appendZoneTab(z)
 
-            bgTab = BGTab(z.background)
-            bgTab.adjustSize()
-            self.BGTabs.append(bgTab)
-
-            tabWidget = QtWidgets.QTabWidget()
-            tabWidget.addTab(tab, 'Options')
-            tabWidget.addTab(bgTab, 'Background')
-            tabWidget.adjustSize()
-
-            scrollArea = ZonesDialog.ScrollArea(tabWidget)
-            self.tabWidget.addTab(scrollArea, ZoneTabName)
+        self.tabWidget.setUpdatesEnabled(True)
 
+        # Tabs past the 5th one already got their short labels
         if self.tabWidget.count() > 5:
-            for tab in range(0, self.tabWidget.count()):
-                self.tabWidget.setTabText(tab, str(tab + 1))
+            self.renameZoneTabs(stop=5)
 
         self.NewButton = QtWidgets.QPushButton(globals.trans.string('ZonesDlg', 4))
         self.DeleteButton = QtWidgets.QPushButton(globals.trans.string('ZonesDlg', 5))
@@ -585,10 +649,11 @@ class ZonesDialog(QtWidgets.QDialog):
         buttonBox.accepted.connect(self.accept)
         buttonBox.rejected.connect(self.reject)
 
-        self.NewButton.setEnabled(len(self.zoneTabs) < 8)
+        canAdd = len(self.zoneTabs) < 8
+        self.NewButton.setEnabled(canAdd)
         self.NewButton.clicked.connect(self.NewZone)
         self.DeleteButton.clicked.connect(self.DeleteZone)
-        self.CloneButton.setEnabled(len(self.zoneTabs) < 8)
+        self.CloneButton.setEnabled(canAdd)
         self.CloneButton.clicked.connect(self.CloneZone)
 
         mainLayout = QtWidgets.QVBoxLayout()
@@ -599,37 +664,65 @@ class ZonesDialog(QtWidgets.QDialog):
         self.resize(self.sizeHint())
         self.setFixedWidth(self.sizeHint().width())
 
-    def NewZone(self):
-        if len(self.zoneTabs) >= 15:
-            result = QtWidgets.QMessageBox.warning(self, globals.trans.string('ZonesDlg', 6), globals.trans.string('ZonesDlg', 7),
-                                                   QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
-            if result == QtWidgets.QMessageBox.No:
-                return
-
-        id = len(self.zoneTabs)
-        z = ZoneItem(256, 256, 448, 224, 0, 0, id, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, (0, 0, 0, 0, 0, 0xF, 0, 0), (0, 0, 0, 0, to_bytes('Black', 16), 0))
-        ZoneTabName = globals.trans.string('ZonesDlg', 3, '[num]', id + 1)
-        tab = ZoneTab(z); tab.adjustSize()
+    def appendZoneTab(self, z):
+        """
+        Creates the tabs for zone z and appends them, returning the new tab index
+        """
+        # No need to adjustSize() anything here, ScrollArea only
+        # needs the size hint and the dialog gets resized afterwards
+        tab = ZoneTab(z)
         self.zoneTabs.append(tab)
 
         bgTab = BGTab(z.background)
-        bgTab.adjustSize()
         self.BGTabs.append(bgTab)
 
         tabWidget = QtWidgets.QTabWidget()
         tabWidget.addTab(tab, 'Options')
         tabWidget.addTab(bgTab, 'Background')
-        tabWidget.adjustSize()
 
         scrollArea = ZonesDialog.ScrollArea(tabWidget)
-        self.tabWidget.addTab(scrollArea, ZoneTabName)
 
-        if self.tabWidget.count() > 5:
-            for tab in range(0, self.tabWidget.count()):
-                self.tabWidget.setTabText(tab, str(tab + 1))
+        index = len(self.zoneTabs) - 1
+        name = self.longTabNames[index] if index < 5 else str(index + 1)
+        return self.tabWidget.addTab(scrollArea, name)
+
+    def renameZoneTabs(self, start=0, stop=None):
+        """
+        Relabels the zone tabs in [start, stop), using short labels if there are more than 5
+        """
+        tabWidget = self.tabWidget
+        count = tabWidget.count()
+        if stop is None or stop > count:
+            stop = count
+
+        if count > 5:
+            for tab in range(start, stop):
+                tabWidget.setTabText(tab, str(tab + 1))
+
+        else:
+            longTabNames = self.longTabNames
+            for tab in range(start, stop):
+                tabWidget.setTabText(tab, longTabNames[tab])
+
+    def NewZone(self):
+        if len(self.zoneTabs) >= 15:
+            result = QtWidgets.QMessageBox.warning(self, _tr('ZonesDlg', 6), _tr('ZonesDlg', 7),
+                                                   QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
+            if result == QtWidgets.QMessageBox.No:
+                return
+
+        id = len(self.zoneTabs)
+        z = ZoneItem(256, 256, 448, 224, 0, 0, id, 0, 0, 0, 0, 0, 0, 0, 0, 0, 1, 0, 0, 0, (0, 0, 0, 0, 0, 0xF, 0, 0), (0, 0, 0, 0, to_bytes('Black', 16), 0))
+        self.appendZoneTab(z)
 
-        self.NewButton.setEnabled(len(self.zoneTabs) < 8)
-        self.CloneButton.setEnabled(len(self.zoneTabs) < 8)
+        # The new tab is already labeled, so only relabel
+        # the others when crossing into the short labels
+        if self.tabWidget.count() == 6:
+            self.renameZoneTabs(stop=5)
+
+        canAdd = len(self.zoneTabs) < 8
+        self.NewButton.setEnabled(canAdd)
+        self.CloneButton.setEnabled(canAdd)
 
         self.resize(self.sizeHint())
         self.setFixedWidth(self.sizeHint().width())
@@ -640,26 +733,25 @@ class ZonesDialog(QtWidgets.QDialog):
         if tabamount == 0: return
         self.tabWidget.removeTab(curindex)
 
-        for tab in range(curindex, tabamount):
-            if self.tabWidget.count() < 6:
-                self.tabWidget.setTabText(tab, globals.trans.string('ZonesDlg', 3, '[num]', tab + 1))
-            else:
-                self.tabWidget.setTabText(tab, str(tab + 1))
-
         self.zoneTabs.pop(curindex)
         self.BGTabs.pop(curindex)
-        if self.tabWidget.count() < 6:
-            for tab in range(0, self.tabWidget.count()):
-                self.tabWidget.setTabText(tab, globals.trans.string('ZonesDlg', 3, '[num]', tab + 1))
 
-                # self.NewButton.setEnabled(len(self.zoneTabs) < 8)
+        # Only the tabs after the deleted one need relabeling,
+        # unless we just went back to the long labels
+        if self.tabWidget.count() == 5:
+            self.renameZoneTabs()
+
+        else:
+            self.renameZoneTabs(curindex)
+
+        # self.NewButton.setEnabled(len(self.zoneTabs) < 8)
 
         self.resize(self.sizeHint())
         self.setFixedWidth(self.sizeHint().width())
 
     def CloneZone(self):
         if len(self.zoneTabs) >= 15:
-            result = QtWidgets.QMessageBox.warning(self, globals.trans.string('ZonesDlg', 6), globals.trans.string('ZonesDlg', 7),
+            result = QtWidgets.QMessageBox.warning(self, _tr('ZonesDlg', 6), _tr('ZonesDlg', 7),
                                                    QtWidgets.QMessageBox.Yes | QtWidgets.QMessageBox.No)
             if result == QtWidgets.QMessageBox.No:
                 return
@@ -667,37 +759,116 @@ class ZonesDialog(QtWidgets.QDialog):
         z0 = self.zoneTabs[self.tabWidget.currentIndex()].zoneObj
 
         id = len(self.zoneTabs)
+        (objx, objy, width, height, modeldark, terraindark,
+         cammode, camzoom, unk1, visibility, unk2, camtrack, unk3, music, sfxmod, type) = _zoneCloneAttrs(z0)
+
         z = ZoneItem(
-            z0.objx, z0.objy, z0.width, z0.height, z0.modeldark, z0.terraindark, id, 0,
-            z0.cammode, z0.camzoom, z0.unk1, z0.visibility, 0, z0.unk2, z0.camtrack, z0.unk3, z0.music, z0.sfxmod, 0, z0.type,
-            (z0.yupperbound, z0.ylowerbound, z0.yupperbound2, z0.ylowerbound2, z0.entryid, z0.mpcamzoomadjust, z0.yupperbound3, z0.ylowerbound3),
-            z0.background,
+            objx, objy, width, height, modeldark, terraindark, id, 0,
+            cammode, camzoom, unk1, visibility, 0, unk2, camtrack, unk3, music, sfxmod, 0, type,
+            _zoneCloneBounds(z0), z0.background,
         )
-        ZoneTabName = globals.trans.string('ZonesDlg', 3, '[num]', id + 1)
-        tab = ZoneTab(z); tab.adjustSize()
-        self.zoneTabs.append(tab)
+        self.appendZoneTab(z)
 
-        bgTab = BGTab(z.background)
-        bgTab.adjustSize()
-        self.BGTabs.append(bgTab)
+        # The new tab is already labeled, so only relabel
+        # the others when crossing into the short labels
+        if self.tabWidget.count() == 6:
+            self.renameZoneTabs(stop=5)
 
-        tabWidget = QtWidgets.QTabWidget()
-        tabWidget.addTab(tab, 'Options')
-        tabWidget.addTab(bgTab, 'Background')
-        tabWidget.adjustSize()
+        canAdd = len(self.zoneTabs) < 8
+        self.NewButton.setEnabled(canAdd)
+        self.CloneButton.setEnabled(canAdd)
 
-        scrollArea = ZonesDialog.ScrollArea(tabWidget)
-        self.tabWidget.addTab(scrollArea, ZoneTabName)
+        self.resize(self.sizeHint())
+        self.setFixedWidth(self.sizeHint().width())
 
-        if self.tabWidget.count() > 5:
-            for tab in range(0, self.tabWidget.count()):
-                self.tabWidget.setTabText(tab, str(tab + 1))
 
-        self.NewButton.setEnabled(len(self.zoneTabs) < 8)
-        self.CloneButton.setEnabled(len(self.zoneTabs) < 8)
+# Common retail zone presets
+# 416 x 224; Zoom Level 0 (used with minigames)
+# 448 x 224; Zoom Level 0 (used with boss battles)
+# 512 x 272; Zoom Level 0 (used in many, many places)
+# 560 x 304; Zoom Level 2
+# 608 x 320; Zoom Level 2 (actually 609x320; rounded it down myself)
+# 784 x 320; Zoom Level 2 (not added to list because it's just an expansion of 608x320)
+# 704 x 384; Zoom Level 3 (used multiple times; therefore it's important)
+# 944 x 448; Zoom Level 4 (used in 9-3 zone 3)
+ZonePresets = (
+    '0: 416x224', '0: 448x224', '0: 512x272', '2: 560x304', '2: 608x320', '3: 704x384', '4: 944x448',
+)
 
-        self.resize(self.sizeHint())
-        self.setFixedWidth(self.sizeHint().width())
+# Index of each zone preset, by its size
+ZonePresetIndices = {preset[3:]: i for i, preset in enumerate(ZonePresets)}
+
+
+def _screenHeightItems(heights):
+    """
+    Formats a list of (screen heights, asterisk) pairs as combobox items
+    """
+    return tuple(
+        '%d: ' % i + ' -> '.join(('%s blocks' % str(o)) for o in options) + asterisk
+        for i, (options, asterisk) in enumerate(heights)
+    )
+
+
+# Screen heights (in blocks) the camera can use, for each group of camera modes
+ScreenHeightLists = (
+    _screenHeightItems([
+        ([14, 19  ]    , ''),
+        ([14, 19  , 24], ''),
+        ([14, 19  , 28], ''),
+        ([20, 24  ]    , ''),
+        ([19, 24  , 28], ''),
+        ([17, 24  ]    , ''),
+        ([17, 24  , 28], ''),
+        ([17, 20  ]    , ''),
+        ([ 7, 11  , 28], '**'),
+        ([17, 20.5, 24], ''),
+        ([17, 20  , 28], ''),
+        ([20,  0  ,  0], ''),  # Needs further testing
+    ]),
+    _screenHeightItems([
+        ([14, 19  ]    , ''),
+        ([14, 19  , 24], ''),
+        ([14, 19  , 28], ''),
+        ([19, 19  , 24], ''),
+        ([19, 24  , 28], ''),
+        ([19, 24  , 28], ''),
+        ([17, 24  , 28], ''),
+        ([17, 20.5, 24], ''),
+        ([17,  0  ,  0], ''),  # Needs further testing
+    ]),
+    _screenHeightItems([
+        ([14  ], ''),
+        ([19  ], ''),
+        ([24  ], ''),
+        ([28  ], ''),
+        ([17  ], ''),
+        ([20  ], ''),
+        ([16  ], ''),
+        ([28  ], ''),
+        ([ 7  ], '*'),
+        ([10.5], '*'),
+    ]),
+)
+
+# Index into ScreenHeightLists for each camera mode
+CamModeHeightLists = (0, 0, 1, 2, 2, 2, 0, 0)
+
+@functools.lru_cache(maxsize=1)
+def _visibilityChoices(trans):
+    """
+    Returns the zone visibility options for each (spotlight << 1) | full dark state,
+    as (items, tooltip, highest valid index, index to use instead of invalid ones)
+    """
+    return (
+        ((trans.string('ZonesDlg', 41),), trans.string('ZonesDlg', 42), 0, 0),
+        (trans.stringList('ZonesDlg', 45), trans.string('ZonesDlg', 46), 5, 5),
+        (trans.stringList('ZonesDlg', 43), trans.string('ZonesDlg', 44), 2, 0),
+        ((trans.string('ZonesDlg', 80),), trans.string('ZonesDlg', 81), 0, 0),
+    )
+
+
+# Bit of the zone type for each of the zone settings checkboxes
+ZoneSettingsMasks = (1, 2, 4, 8, 16, 32, 64, 128)
 
 
 class ZoneTab(QtWidgets.QWidget):
@@ -733,10 +904,10 @@ class ZoneTab(QtWidgets.QWidget):
         self.Zone_ypos.setValue(z.objy)
 
         self.snapButton8 = QtWidgets.QPushButton(globals.trans.string('ZonesDlg', 78))
-        self.snapButton8.clicked.connect(lambda: self.HandleSnapTo8x8Grid(z))
+        self.snapButton8.clicked.connect(functools.partial(self.HandleSnapTo8x8Grid, z))
 
         self.snapButton16 = QtWidgets.QPushButton(globals.trans.string('ZonesDlg', 79))
-        self.snapButton16.clicked.connect(lambda: self.HandleSnapTo16x16Grid(z))
+        self.snapButton16.clicked.connect(functools.partial(self.HandleSnapTo16x16Grid, z))
 
         self.Zone_width = QtWidgets.QSpinBox()
         self.Zone_width.setRange(80, 65535)
@@ -750,20 +921,8 @@ class ZoneTab(QtWidgets.QWidget):
         self.Zone_height.setValue(z.height)
         self.Zone_height.valueChanged.connect(self.PresetDeselected)
 
-        # Common retail zone presets
-        # 416 x 224; Zoom Level 0 (used with minigames)
-        # 448 x 224; Zoom Level 0 (used with boss battles)
-        # 512 x 272; Zoom Level 0 (used in many, many places)
-        # 560 x 304; Zoom Level 2
-        # 608 x 320; Zoom Level 2 (actually 609x320; rounded it down myself)
-        # 784 x 320; Zoom Level 2 (not added to list because it's just an expansion of 608x320)
-        # 704 x 384; Zoom Level 3 (used multiple times; therefore it's important)
-        # 944 x 448; Zoom Level 4 (used in 9-3 zone 3)
-        self.Zone_presets_values = (
-        '0: 416x224', '0: 448x224', '0: 512x272', '2: 560x304', '2: 608x320', '3: 704x384', '4: 944x448')
-
         self.Zone_presets = QtWidgets.QComboBox()
-        self.Zone_presets.addItems(self.Zone_presets_values)
+        self.Zone_presets.addItems(ZonePresets)
         self.Zone_presets.setToolTip(globals.trans.string('ZonesDlg', 18))
         self.Zone_presets.currentIndexChanged.connect(self.PresetSelected)
         self.PresetDeselected()  # can serve as an initializer for self.Zone_presets
@@ -798,101 +957,29 @@ class ZoneTab(QtWidgets.QWidget):
         """
         Snaps the current zone to an 8x8 grid
         """
-        left = self.Zone_xpos.value()
-        top = self.Zone_ypos.value()
-        right = left + self.Zone_width.value()
-        bottom = top + self.Zone_height.value()
-
-        if left % 8 < 4:
-            left -= (left % 8)
-        else:
-            left += 8 - (left % 8)
-
-        if top % 8 < 4:
-            top -= (top % 8)
-        else:
-            top += 8 - (top % 8)
-
-        if right % 8 < 4:
-            right -= (right % 8)
-        else:
-            right += 8 - (right % 8)
-
-        if bottom % 8 < 4:
-            bottom -= (bottom % 8)
-        else:
-            bottom += 8 - (bottom % 8)
-
-        if right <= left: right += 8
-        if bottom <= top: bottom += 8
-
-        right -= left
-        bottom -= top
-
-        if left < 16: left = 16
-        if top < 16: top = 16
-        if right < 80: right = 80
-        if bottom < 16: bottom = 16
-
-        if left > 65528: left = 65528
-        if top > 65528: top = 65528
-        if right > 65528: right = 65528
-        if bottom > 65528: bottom = 65528
+        left, top, width, height = SnapZoneToGrid(
+            self.Zone_xpos.value(), self.Zone_ypos.value(),
+            self.Zone_width.value(), self.Zone_height.value(), 8,
+        )
 
         self.Zone_xpos.setValue(left)
         self.Zone_ypos.setValue(top)
-        self.Zone_width.setValue(right)
-        self.Zone_height.setValue(bottom)
+        self.Zone_width.setValue(width)
+        self.Zone_height.setValue(height)
 
     def HandleSnapTo16x16Grid(self, z):
         """
         Snaps the current zone to a 16x16 grid
         """
-        left = self.Zone_xpos.value()
-        top = self.Zone_ypos.value()
-        right = left + self.Zone_width.value()
-        bottom = top + self.Zone_height.value()
-
-        if left % 16 < 8:
-            left -= (left % 16)
-        else:
-            left += 16 - (left % 16)
-
-        if top % 16 < 8:
-            top -= (top % 16)
-        else:
-            top += 16 - (top % 16)
-
-        if right % 16 < 8:
-            right -= (right % 16)
-        else:
-            right += 16 - (right % 16)
-
-        if bottom % 16 < 8:
-            bottom -= (bottom % 16)
-        else:
-            bottom += 16 - (bottom % 16)
-
-        if right <= left: right += 16
-        if bottom <= top: bottom += 16
-
-        right -= left
-        bottom -= top
-
-        if left < 16: left = 16
-        if top < 16: top = 16
-        if right < 80: right = 80
-        if bottom < 16: bottom = 16
-
-        if left > 65520: left = 65520
-        if top > 65520: top = 65520
-        if right > 65520: right = 65520
-        if bottom > 65520: bottom = 65520
+        left, top, width, height = SnapZoneToGrid(
+            self.Zone_xpos.value(), self.Zone_ypos.value(),
+            self.Zone_width.value(), self.Zone_height.value(), 16,
+        )
 
         self.Zone_xpos.setValue(left)
         self.Zone_ypos.setValue(top)
-        self.Zone_width.setValue(right)
-        self.Zone_height.setValue(bottom)
+        self.Zone_width.setValue(width)
+        self.Zone_height.setValue(height)
 
     def createVisibility(self, z):
         self.Visibility = QtWidgets.QGroupBox(globals.trans.string('ZonesDlg', 19))
@@ -906,6 +993,16 @@ class ZoneTab(QtWidgets.QWidget):
         self.Zone_visibility = QtWidgets.QComboBox()
         self.zv = z.visibility
 
+        # Prebuild the visibility list for each checkbox state,
+        # so toggling them only needs to swap the combobox model
+        self.visibilityModels = []
+        for items, _, _, _ in _visibilityChoices(globals.trans):
+            model = QtGui.QStandardItemModel(self)
+            for item in items:
+                model.appendRow(QtGui.QStandardItem(item))
+
+            self.visibilityModels.append(model)
+
         if self.zv & 0x10:
             self.Zone_vspotlight.setChecked(True)
         if self.zv & 0x20:
@@ -955,7 +1052,7 @@ class ZoneTab(QtWidgets.QWidget):
             if i == cammode:
                 rb.setChecked(True)
 
-            rb.clicked.connect(self.ChangeCamModeList)
+        self.Zone_cammodebuttongroup.buttonClicked[int].connect(self.ChangeCamModeList)
 
         self.Zone_screenheights = QtWidgets.QComboBox()
         self.Zone_screenheights.setToolTip("<b>Screen Heights:</b><br>Selects screen heights (in blocks) the camera can use during multiplayer. " \
@@ -966,7 +1063,7 @@ class ZoneTab(QtWidgets.QWidget):
                                            "Options marked with * or ** are glitchy if zone bounds are set to 0; see the Upper/Lower Bounds tooltips for more info.<br>" \
                                            "Options marked with ** are also unplayably glitchy in multiplayer.")
 
-        self.ChangeCamModeList()
+        self.ChangeCamModeList(cammode)
         self.Zone_screenheights.setCurrentIndex(camzoom)
 
         directionmodeValues = globals.trans.stringList('ZonesDlg', 38)
@@ -1021,16 +1118,18 @@ class ZoneTab(QtWidgets.QWidget):
         ZoneSettingsRight = QtWidgets.QFormLayout()
         settingsNames = globals.trans.stringList('ZonesDlg', 77)
         
-        for i in range(0, 8):
-            self.Zone_settings.append(QtWidgets.QCheckBox())
-            self.Zone_settings[i].setChecked(z.type & 1 << i)
-            self.Zone_settings[i].setStyleSheet("margin-left:100%;");
+        # The first four settings go in the left column, the rest in the right one
+        settingsLayouts = (ZoneSettingsLeft,) * 4 + (ZoneSettingsRight,) * 4
+        ztype = z.type
+
+        for name, layout, mask in zip(settingsNames, settingsLayouts, ZoneSettingsMasks):
+            checkbox = QtWidgets.QCheckBox()
+            checkbox.setChecked(bool(ztype & mask))
+            checkbox.setStyleSheet("margin-left:100%;")
+
+            layout.addRow(name, checkbox)
+            self.Zone_settings.append(checkbox)
 
-            if i < 4:
-                ZoneSettingsLeft.addRow(settingsNames[i], self.Zone_settings[i])
-            else:
-                ZoneSettingsRight.addRow(settingsNames[i], self.Zone_settings[i])
-            
         ZoneSettingsLayout = QtWidgets.QHBoxLayout()
         ZoneSettingsLayout.addLayout(ZoneSettingsLeft)
         ZoneSettingsLayout.addStretch()
@@ -1050,83 +1149,23 @@ class ZoneTab(QtWidgets.QWidget):
         self.Visibility.setLayout(InnerLayout)
 
     def ChangeVisibilityList(self):
+        state = (self.Zone_vspotlight.isChecked() << 1) | self.Zone_vfulldark.isChecked()
+        _, tooltip, maxIndex, fallbackIndex = _visibilityChoices(globals.trans)[state]
+
         SelectedIndex = self.zv & 0x0F
-        self.Zone_visibility.clear()
-
-        if not self.Zone_vspotlight.isChecked() and not self.Zone_vfulldark.isChecked():
-            self.Zone_visibility.addItem(globals.trans.string('ZonesDlg', 41))
-            self.Zone_visibility.setToolTip(globals.trans.string('ZonesDlg', 42))
-            SelectedIndex = 0
-        elif self.Zone_vspotlight.isChecked() and self.Zone_vfulldark.isChecked():
-            self.Zone_visibility.addItem(globals.trans.string('ZonesDlg', 80))
-            self.Zone_visibility.setToolTip(globals.trans.string('ZonesDlg', 81))
-            SelectedIndex = 0
-        elif self.Zone_vspotlight.isChecked():
-            self.Zone_visibility.addItems(globals.trans.stringList('ZonesDlg', 43))
-            self.Zone_visibility.setToolTip(globals.trans.string('ZonesDlg', 44))
-            if SelectedIndex > 2: SelectedIndex = 0
-        elif self.Zone_vfulldark.isChecked():
-            self.Zone_visibility.addItems(globals.trans.stringList('ZonesDlg', 45))
-            self.Zone_visibility.setToolTip(globals.trans.string('ZonesDlg', 46))
-            if SelectedIndex > 5: SelectedIndex = 5
-        
-        self.Zone_visibility.setCurrentIndex(SelectedIndex)
+        if SelectedIndex > maxIndex: SelectedIndex = fallbackIndex
 
-    def ChangeCamModeList(self):
-        mode = self.Zone_cammodebuttongroup.checkedId()
+        self.Zone_visibility.setModel(self.visibilityModels[state])
+        self.Zone_visibility.setToolTip(tooltip)
+        self.Zone_visibility.setCurrentIndex(SelectedIndex)
 
-        oldListChoice = [1, 1, 2, 3, 3, 3, 1, 1][self.zm]
-        newListChoice = [1, 1, 2, 3, 3, 3, 1, 1][mode]
+    def ChangeCamModeList(self, mode):
+        oldListChoice = CamModeHeightLists[self.zm]
+        newListChoice = CamModeHeightLists[mode]
 
         if self.zm == -1 or oldListChoice != newListChoice:
-
-            if newListChoice == 1:
-                heights = [
-                    ([14, 19  ]    , ''),
-                    ([14, 19  , 24], ''),
-                    ([14, 19  , 28], ''),
-                    ([20, 24  ]    , ''),
-                    ([19, 24  , 28], ''),
-                    ([17, 24  ]    , ''),
-                    ([17, 24  , 28], ''),
-                    ([17, 20  ]    , ''),
-                    ([ 7, 11  , 28], '**'),
-                    ([17, 20.5, 24], ''),
-                    ([17, 20  , 28], ''),
-                    ([20,  0  ,  0], ''),  # Needs further testing
-                ]
-            elif newListChoice == 2:
-                heights = [
-                    ([14, 19  ]    , ''),
-                    ([14, 19  , 24], ''),
-                    ([14, 19  , 28], ''),
-                    ([19, 19  , 24], ''),
-                    ([19, 24  , 28], ''),
-                    ([19, 24  , 28], ''),
-                    ([17, 24  , 28], ''),
-                    ([17, 20.5, 24], ''),
-                    ([17,  0  ,  0], ''),  # Needs further testing
-                ]
-            else:
-                heights = [
-                    ([14  ], ''),
-                    ([19  ], ''),
-                    ([24  ], ''),
-                    ([28  ], ''),
-                    ([17  ], ''),
-                    ([20  ], ''),
-                    ([16  ], ''),
-                    ([28  ], ''),
-                    ([ 7  ], '*'),
-                    ([10.5], '*'),
-                ]
-
-            items = []
-            for i, (options, asterisk) in enumerate(heights):
-                items.append('%d: ' % i + ' -> '.join(('%s blocks' % str(o)) for o in options) + asterisk)
-
             self.Zone_screenheights.clear()
-            self.Zone_screenheights.addItems(items)
+            self.Zone_screenheights.addItems(ScreenHeightLists[newListChoice])
             self.Zone_screenheights.setCurrentIndex(0)
             self.zm = mode
 
@@ -1207,9 +1246,13 @@ class ZoneTab(QtWidgets.QWidget):
         newItems = gamedefs.getMusic()
         del gamedefs
 
-        for a, b in newItems:
+        # Row of each song id, so we don't need findData() to sync the combobox
+        self.musicRows = {}
+        for row, (a, b) in enumerate(newItems):
             self.Zone_music.addItem(b, a)  # text, songid
-        self.Zone_music.setCurrentIndex(self.Zone_music.findData(z.music))
+            self.musicRows.setdefault(int(a), row)
+
+        self.Zone_music.setCurrentIndex(self.musicRows.get(z.music, -1))
         self.Zone_music.currentIndexChanged.connect(self.handleMusicListSelect)
 
         self.Zone_musicid = QtWidgets.QSpinBox()
@@ -1258,7 +1301,7 @@ class ZoneTab(QtWidgets.QWidget):
         # BUG: The music entries are out of order
 
         self.AutoEditMusic = True
-        self.Zone_music.setCurrentIndex(self.Zone_music.findData(id))
+        self.Zone_music.setCurrentIndex(self.musicRows.get(id, -1))
         self.AutoEditMusic = False
 
     def PresetSelected(self, info=None):
@@ -1267,15 +1310,17 @@ class ZoneTab(QtWidgets.QWidget):
         """
         if self.AutoChangingSize: return
 
-        if self.Zone_presets.currentText() == globals.trans.string('ZonesDlg', 60): return
-        w, h = self.Zone_presets.currentText()[3:].split('x')
+        custom = _tr('ZonesDlg', 60)
+        text = self.Zone_presets.currentText()
+        if text == custom: return
+        w, h = text[3:].split('x')
 
         self.AutoChangingSize = True
         self.Zone_width.setValue(int(w))
         self.Zone_height.setValue(int(h))
         self.AutoChangingSize = False
 
-        if self.Zone_presets.itemText(0) == globals.trans.string('ZonesDlg', 60): self.Zone_presets.removeItem(0)
+        if self.Zone_presets.itemText(0) == custom: self.Zone_presets.removeItem(0)
 
     def PresetDeselected(self, info=None):
         """
@@ -1288,23 +1333,27 @@ class ZoneTab(QtWidgets.QWidget):
         h = self.Zone_height.value()
         check = str(w) + 'x' + str(h)
 
-        found = None
-        for preset in self.Zone_presets_values:
-            if check == preset[3:]: found = preset
+        found = ZonePresetIndices.get(check)
+
+        custom = _tr('ZonesDlg', 60)
+        hasCustom = self.Zone_presets.itemText(0) == custom
 
         if found is not None:
-            self.Zone_presets.setCurrentIndex(self.Zone_presets.findText(found))
-            if self.Zone_presets.itemText(0) == globals.trans.string('ZonesDlg', 60): self.Zone_presets.removeItem(0)
+            if hasCustom: self.Zone_presets.removeItem(0)
+            self.Zone_presets.setCurrentIndex(found)
         else:
-            if self.Zone_presets.itemText(0) != globals.trans.string('ZonesDlg', 60): self.Zone_presets.insertItem(0,
-                                                                                                           globals.trans.string(
-                                                                                                               'ZonesDlg',
-                                                                                                               60))
+            if not hasCustom: self.Zone_presets.insertItem(0, custom)
             self.Zone_presets.setCurrentIndex(0)
         self.AutoChangingSize = False
 
 
 class BGTab(QtWidgets.QWidget):
+    # Preview folders, filenames and pixmaps, shared by all BGTabs of the current gamedef
+    _previewGamedef = None
+    _previewFolders = None
+    _previewPathCache = {}
+    _previewPixmapCache = {}
+
     def __init__(self, background):
         super().__init__()
 
@@ -1367,7 +1416,17 @@ class BGTab(QtWidgets.QWidget):
         Layout.addWidget(self.BGSettings)
         self.setLayout(Layout)
 
-        self.updatePreview()
+        # The preview is loaded when the tab is first shown
+        self.previewLoaded = False
+
+    def showEvent(self, event):
+        """
+        Loads the preview the first time the tab is shown
+        """
+        if not self.previewLoaded:
+            self.updatePreview()
+
+        super().showEvent(event)
 
     def createBGViewers(self):
         self.BGViewer = QtWidgets.QGroupBox(globals.trans.string('BGDlg', 16))
@@ -1396,23 +1455,41 @@ class BGTab(QtWidgets.QWidget):
         """
         Updates the preview label
         """
-        if self.bgName.currentText() == 'Custom filename...':
+        self.previewLoaded = True
+
+        if BGTab._previewGamedef is not globals.gamedef:
+            BGTab._previewGamedef = globals.gamedef
+            BGTab._previewFolders = None
+            BGTab._previewPathCache.clear()
+            BGTab._previewPixmapCache.clear()
+
+        name = self.bgName.currentText()
+        if name == 'Custom filename...':
             filename = globals.miyamoto_path + '/miyamotodata/bg/no_preview.png'
 
+        elif name in BGTab._previewPathCache:
+            filename = BGTab._previewPathCache[name]
+
         else:
-            folders = globals.gamedef.recursiveFiles('bg', False, True)
-            folders.append(os.path.join(globals.miyamoto_path, 'miyamotodata/bg'))
+            if BGTab._previewFolders is None:
+                folders = globals.gamedef.recursiveFiles('bg', False, True)
+                folders.append(os.path.join(globals.miyamoto_path, 'miyamotodata/bg'))
+                BGTab._previewFolders = folders
 
-            for folder in folders:
-                filename = os.path.join(folder, self.bgName.currentText() + '.png')
+            for folder in BGTab._previewFolders:
+                filename = os.path.join(folder, name + '.png')
                 if os.path.isfile(filename):
                     break
 
             else:
                 filename = globals.miyamoto_path + '/miyamotodata/bg/no_preview.png'
 
-        pix = QtGui.QPixmap(filename)
-        self.preview.setPixmap(pix)
+            BGTab._previewPathCache[name] = filename
+
+        if filename not in BGTab._previewPixmapCache:
+            BGTab._previewPixmapCache[filename] = QtGui.QPixmap(filename)
+
+        self.preview.setPixmap(BGTab._previewPixmapCache[filename])
 
 
 class ScreenCapChoiceDialog(QtWidgets.QDialog):
@@ -1531,6 +1608,67 @@ class AreaChoiceDialog(QtWidgets.QDialog):
         self.setLayout(mainLayout)
 
 
+# Display names of the translations, by folder name
+_translationNames = {}
+
+def _availableThemes():
+    """Searches the Themes folder and returns a list of theme names.
+    Automatically adds 'Classic' to the list."""
+    themeList = ['Classic']
+    with os.scandir(globals.miyamoto_path + '/miyamotodata/themes') as entries:
+        for entry in entries:
+            if entry.is_dir() and os.path.isfile(os.path.join(entry.path, 'main.xml')):
+                themeList.append(entry.name)
+
+    return tuple(themeList)
+
+
+# Theme colors used by the theme preview
+ThemePreviewColors = (
+    'bg', 'spritebox_lines', 'spritebox_fill', 'entrance_lines', 'entrance_fill',
+    'location_lines', 'location_fill', 'location_text', 'zone_lines', 'zone_corner', 'zone_text', 'grid',
+)
+
+# Theme preview pixmaps, by the rgba values of the colors above
+_themePreviewCache = {}
+
+
+@functools.lru_cache(maxsize=None)
+def _themePreviewPaths(tilewidth):
+    """
+    Returns the theme-independent shapes of the theme preview, as painter
+    paths: spriteboxes, entrance, location, zone and zone corners
+    """
+    spriteboxPath = QtGui.QPainterPath()
+    spriteboxPath.addRoundedRect(11 * tilewidth, 4 * tilewidth, tilewidth, tilewidth, 5, 5)
+    spriteboxPath.addRoundedRect(tilewidth, 6 * tilewidth, tilewidth, tilewidth, 5, 5)
+
+    entrancePath = QtGui.QPainterPath()
+    entrancePath.addRoundedRect(13 * tilewidth, 8 * tilewidth, tilewidth, tilewidth, 5, 5)
+
+    locationPath = QtGui.QPainterPath()
+    locationPath.addRect(tilewidth, 9 * tilewidth, 6 * tilewidth, 2 * tilewidth)
+
+    zonePath = QtGui.QPainterPath()
+    zonePath.addRect(8.5 * tilewidth, 3.25 * tilewidth, 16 * tilewidth, 7.5 * tilewidth)
+
+    zoneCornerPath = QtGui.QPainterPath()
+    zoneCornerPath.addRect(8.4375 * tilewidth, 3.1875 * tilewidth, 0.125 * tilewidth, 0.125 * tilewidth)
+    zoneCornerPath.addRect(8.4375 * tilewidth, 10.6875 * tilewidth, 0.125 * tilewidth, 0.125 * tilewidth)
+
+    return spriteboxPath, entrancePath, locationPath, zonePath, zoneCornerPath
+
+
+@functools.lru_cache(maxsize=None)
+def _numberFont(pointSize):
+    """
+    Returns a copy of the number font with the given point size
+    """
+    font = QtGui.QFont(globals.NumberFont) # need to make a new instance to avoid changing global settings
+    font.setPointSize(pointSize)
+    return font
+
+
 class PreferencesDialog(QtWidgets.QDialog):
     """
     Dialog which lets you customize Miyamoto
@@ -1541,21 +1679,32 @@ class PreferencesDialog(QtWidgets.QDialog):
         Creates and initializes the dialog
         """
         super().__init__()
-        self.setWindowTitle(globals.trans.string('PrefsDlg', 0))
+        self.setWindowTitle(_tr('PrefsDlg', 0))
         self.setWindowIcon(GetIcon('settings'))
 
         # Create the tab widget
         self.tabWidget = QtWidgets.QTabWidget()
-        self.tabWidget.currentChanged.connect(self.tabChanged)
 
         # Create other widgets
         self.infoLabel = QtWidgets.QLabel()
-        self.generalTab = self.getGeneralTab()
-        self.toolbarTab = self.getToolbarTab()
-        self.themesTab = self.getThemesTab(QtWidgets.QWidget)()
-        self.tabWidget.addTab(self.generalTab, globals.trans.string('PrefsDlg', 1))
-        self.tabWidget.addTab(self.toolbarTab, globals.trans.string('PrefsDlg', 2))
-        self.tabWidget.addTab(self.themesTab, globals.trans.string('PrefsDlg', 3))
+
+        # The tabs are only built once they're first needed, each
+        # one goes into the layout of a placeholder page until then
+        self.tabBuilders = (
+            self.getGeneralTab,
+            self.getToolbarTab,
+            lambda: self.getThemesTab(QtWidgets.QWidget)(),
+        )
+        self.tabs = [None] * len(self.tabBuilders)
+
+        for i in range(len(self.tabBuilders)):
+            page = QtWidgets.QWidget()
+            pageLayout = QtWidgets.QVBoxLayout()
+            pageLayout.setContentsMargins(0, 0, 0, 0)
+            page.setLayout(pageLayout)
+            self.tabWidget.addTab(page, _tr('PrefsDlg', i + 1))
+
+        self.tabWidget.currentChanged.connect(self.tabChanged)
 
         # Create the buttonbox
         buttonBox = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
@@ -1576,7 +1725,44 @@ class PreferencesDialog(QtWidgets.QDialog):
         """
         Handles the current tab being changed
         """
-        self.infoLabel.setText(self.tabWidget.currentWidget().info)
+        self.infoLabel.setText(self.getTab(self.tabWidget.currentIndex()).info)
+
+    def getTab(self, index):
+        """
+        Returns the tab at index, building it if it hasn't been yet
+        """
+        if self.tabs[index] is None:
+            tab = self.tabBuilders[index]()
+            self.tabWidget.widget(index).layout().addWidget(tab)
+            self.tabs[index] = tab
+
+        return self.tabs[index]
+
+    def isTabBuilt(self, index):
+        """
+        Returns whether the tab at index has been built yet
+        """
+        return self.tabs[index] is not None
+
+    @property
+    def generalTab(self):
+        return self.getTab(0)
+
+    @property
+    def toolbarTab(self):
+        return self.getTab(1)
+
+    @property
+    def themesTab(self):
+        return self.getTab(2)
+
+    @property
+    def toolbarTabBuilt(self):
+        return self.isTabBuilt(1)
+
+    @property
+    def themesTabBuilt(self):
+        return self.isTabBuilt(2)
 
     def getGeneralTab(self):
         """
@@ -1587,7 +1773,7 @@ class PreferencesDialog(QtWidgets.QDialog):
             """
             General Tab
             """
-            info = globals.trans.string('PrefsDlg', 4)
+            info = _tr('PrefsDlg', 4)
 
             def __init__(self):
                 """
@@ -1596,7 +1782,7 @@ class PreferencesDialog(QtWidgets.QDialog):
                 super().__init__()
 
                 # Add the Clear Recent Files button
-                ClearRecentBtn = QtWidgets.QPushButton(globals.trans.string('PrefsDlg', 16))
+                ClearRecentBtn = QtWidgets.QPushButton(_tr('PrefsDlg', 16))
                 ClearRecentBtn.setMaximumWidth(ClearRecentBtn.minimumSizeHint().width())
                 ClearRecentBtn.clicked.connect(self.ClearRecent)
 
@@ -1609,28 +1795,23 @@ class PreferencesDialog(QtWidgets.QDialog):
                 self.compLevel.setMaximumWidth(256)
 
                 if globals.libyaz0_available:
-                    for i in range(33, 43):
-                        self.compLevel.addItem(globals.trans.string('PrefsDlg', i))
+                    self.compLevel.addItems([_tr('PrefsDlg', i) for i in range(33, 43)])
 
                     self.compLevel.setCurrentIndex(globals.CompLevel)
 
                 else:
-                    self.compLevel.addItem(globals.trans.string('PrefsDlg', 42))
+                    self.compLevel.addItem(_tr('PrefsDlg', 42))
                     self.compLevel.setCurrentIndex(0)
 
                 # Add the Embedded tab type determiner
                 self.separate = QtWidgets.QCheckBox()
                 self.separate.setChecked(globals.isEmbeddedSeparate)
 
-                from spritelib import RotationFPS
-
                 # Add the pivotal rotation animation FPS specifier
                 self.rotationFPS = QtWidgets.QSpinBox()
                 self.rotationFPS.setMaximumWidth(256)
                 self.rotationFPS.setRange(1, 60)
-                self.rotationFPS.setValue(RotationFPS)
-
-                del RotationFPS
+                self.rotationFPS.setValue(SLib.RotationFPS)
 
                 # Add the option to modify the inner sarc name
                 self.modifyInnerName = QtWidgets.QCheckBox()
@@ -1638,12 +1819,12 @@ class PreferencesDialog(QtWidgets.QDialog):
 
                 # Create the main layout
                 L = QtWidgets.QFormLayout()
-                L.addRow(globals.trans.string('PrefsDlg', 14), self.Trans)
-                L.addRow(globals.trans.string('PrefsDlg', 15), ClearRecentBtn)
-                L.addRow(globals.trans.string('PrefsDlg', 32), self.compLevel)
-                L.addRow(globals.trans.string('PrefsDlg', 43), self.separate)
-                L.addRow(globals.trans.string('PrefsDlg', 45), self.rotationFPS)
-                L.addRow(globals.trans.string('PrefsDlg', 44), self.modifyInnerName)
+                L.addRow(_tr('PrefsDlg', 14), self.Trans)
+                L.addRow(_tr('PrefsDlg', 15), ClearRecentBtn)
+                L.addRow(_tr('PrefsDlg', 32), self.compLevel)
+                L.addRow(_tr('PrefsDlg', 43), self.separate)
+                L.addRow(_tr('PrefsDlg', 45), self.rotationFPS)
+                L.addRow(_tr('PrefsDlg', 44), self.modifyInnerName)
                 self.setLayout(L)
 
                 # Set the buttons
@@ -1657,14 +1838,19 @@ class PreferencesDialog(QtWidgets.QDialog):
                 self.Trans.setItemData(0, None, Qt.UserRole)
                 self.Trans.setCurrentIndex(0)
                 i = 1
-                for trans in os.listdir('miyamotodata/translations'):
+                with os.scandir('miyamotodata/translations') as entries:
+                    translations = [entry.name for entry in entries if entry.is_dir()]
+
+                for trans in translations:
                     if trans.lower() == 'english': continue
 
                     fp = 'miyamotodata/translations/' + trans + '/main.xml'
                     if not os.path.isfile(fp): continue
 
-                    transobj = MiyamotoTranslation(trans)
-                    name = transobj.name
+                    if trans not in _translationNames:
+                        _translationNames[trans] = MiyamotoTranslation(trans).name
+
+                    name = _translationNames[trans]
                     self.Trans.addItem(name)
                     self.Trans.setItemData(i, trans, Qt.UserRole)
                     if trans == str(setting('Translation')):
@@ -1675,7 +1861,7 @@ class PreferencesDialog(QtWidgets.QDialog):
                 """
                 Handle the Clear Recent Files button being clicked
                 """
-                ans = QtWidgets.QMessageBox.question(None, globals.trans.string('PrefsDlg', 17), globals.trans.string('PrefsDlg', 18), QtWidgets.QMessageBox.Yes, QtWidgets.QMessageBox.No)
+                ans = QtWidgets.QMessageBox.question(None, _tr('PrefsDlg', 17), _tr('PrefsDlg', 18), QtWidgets.QMessageBox.Yes, QtWidgets.QMessageBox.No)
                 if ans != QtWidgets.QMessageBox.Yes: return
                 globals.mainWindow.RecentMenu.clearAll()
 
@@ -1690,7 +1876,7 @@ class PreferencesDialog(QtWidgets.QDialog):
             """
             Toolbar Tab
             """
-            info = globals.trans.string('PrefsDlg', 5)
+            info = _tr('PrefsDlg', 5)
 
             def __init__(self):
                 """
@@ -1699,18 +1885,16 @@ class PreferencesDialog(QtWidgets.QDialog):
                 super().__init__()
 
                 # Determine which keys are activated
-                if setting('ToolbarActs') in (None, 'None', 'none', '', 0):
+                toolbarActs = setting('ToolbarActs')
+                if toolbarActs in (None, 'None', 'none', '', 0):
                     # Get the default settings
-                    toggled = {}
-                    for List in (globals.FileActions, globals.EditActions, globals.ViewActions, globals.SettingsActions, globals.HelpActions):
-                        for name, activated, key in List:
-                            toggled[key] = activated
-                else:  # Get the registry settings
-                    toggled = setting('ToolbarActs')
-                    newToggled = {}  # here, I'm replacing QStrings w/ python strings
-                    for key in toggled:
-                        newToggled[str(key)] = toggled[key]
-                    toggled = newToggled
+                    toggled = {
+                        key: activated
+                        for List in (globals.FileActions, globals.EditActions, globals.ViewActions, globals.SettingsActions, globals.HelpActions)
+                        for name, activated, key in List
+                    }
+                else:  # Get the registry settings, replacing QStrings w/ python strings
+                    toggled = {str(key): value for key, value in toolbarActs.items()}
 
                 # Create some data
                 self.FileBoxes = []
@@ -1723,41 +1907,38 @@ class PreferencesDialog(QtWidgets.QDialog):
                 VL = QtWidgets.QVBoxLayout()
                 SL = QtWidgets.QVBoxLayout()
                 HL = QtWidgets.QVBoxLayout()
-                FB = QtWidgets.QGroupBox(globals.trans.string('Menubar', 0))
-                EB = QtWidgets.QGroupBox(globals.trans.string('Menubar', 1))
-                VB = QtWidgets.QGroupBox(globals.trans.string('Menubar', 2))
-                SB = QtWidgets.QGroupBox(globals.trans.string('Menubar', 3))
-                HB = QtWidgets.QGroupBox(globals.trans.string('Menubar', 5))
+                FB = QtWidgets.QGroupBox(_tr('Menubar', 0))
+                EB = QtWidgets.QGroupBox(_tr('Menubar', 1))
+                VB = QtWidgets.QGroupBox(_tr('Menubar', 2))
+                SB = QtWidgets.QGroupBox(_tr('Menubar', 3))
+                HB = QtWidgets.QGroupBox(_tr('Menubar', 5))
 
                 # Arrange this data so it can be iterated over
-                menuItems = (
-                    (globals.FileActions, self.FileBoxes, FL, FB),
-                    (globals.EditActions, self.EditBoxes, EL, EB),
-                    (globals.ViewActions, self.ViewBoxes, VL, VB),
-                    (globals.SettingsActions, self.SettingsBoxes, SL, SB),
-                    (globals.HelpActions, self.HelpBoxes, HL, HB),
+                self.menuItems = (
+                    (self.FileBoxes, globals.FileActions),
+                    (self.EditBoxes, globals.EditActions),
+                    (self.ViewBoxes, globals.ViewActions),
+                    (self.SettingsBoxes, globals.SettingsActions),
+                    (self.HelpBoxes, globals.HelpActions),
                 )
 
                 # Set up the menus by iterating over the above data
-                for defaults, boxes, layout, group in menuItems:
+                for (boxes, defaults), layout, group in zip(self.menuItems, (FL, EL, VL, SL, HL), (FB, EB, VB, SB, HB)):
                     for L, C, I in defaults:
                         box = QtWidgets.QCheckBox(L)
                         boxes.append(box)
                         layout.addWidget(box)
-                        try:
-                            box.setChecked(toggled[I])
-                        except KeyError:
-                            pass
+                        box.setChecked(toggled.get(I, False))
                         box.InternalName = I  # to save settings later
                     group.setLayout(layout)
 
                 # Create the always-enabled Current Area checkbox
-                CurrentArea = QtWidgets.QCheckBox(globals.trans.string('PrefsDlg', 19))
+                CurrentArea = QtWidgets.QCheckBox(_tr('PrefsDlg', 19))
                 CurrentArea.setChecked(True)
                 CurrentArea.setEnabled(False)
 
                 # Create the Reset button
-                reset = QtWidgets.QPushButton(globals.trans.string('PrefsDlg', 20))
+                reset = QtWidgets.QPushButton(_tr('PrefsDlg', 20))
                 reset.clicked.connect(self.reset)
 
                 # Create the main layout
@@ -1775,15 +1956,7 @@ class PreferencesDialog(QtWidgets.QDialog):
                 """
                 This is called when the Reset button is clicked
                 """
-                items = (
-                    (self.FileBoxes, globals.FileActions),
-                    (self.EditBoxes, globals.EditActions),
-                    (self.ViewBoxes, globals.ViewActions),
-                    (self.SettingsBoxes, globals.SettingsActions),
-                    (self.HelpBoxes, globals.HelpActions)
-                )
-
-                for boxes, defaults in items:
+                for boxes, defaults in self.menuItems:
                     for box, default in zip(boxes, defaults):
                         box.setChecked(default[1])
 
@@ -1799,7 +1972,7 @@ class PreferencesDialog(QtWidgets.QDialog):
             """
             Themes Tab
             """
-            info = globals.trans.string('PrefsDlg', 6)
+            info = _tr('PrefsDlg', 6)
 
             def __init__(self):
                 """
@@ -1809,14 +1982,19 @@ class PreferencesDialog(QtWidgets.QDialog):
 
                 # Get the current and available themes
                 self.themeID = globals.theme.themeName
-                self.themes = self.getAvailableThemes
+                self.themes = self.getAvailableThemes()
+                self.loadedThemes = {}
+
+                # Index the themes by name (case-insensitively, like MatchFixedString)
+                themeIndices = {}
+                for i, name in enumerate(self.themes):
+                    themeIndices.setdefault(name.lower(), i)
 
                 # Create the theme box
                 self.themeBox = QtWidgets.QComboBox()
-                for name, themeObj in self.themes:
-                    self.themeBox.addItem(name)
+                self.themeBox.addItems(self.themes)
 
-                index = self.themeBox.findText(setting('Theme'), Qt.MatchFixedString)
+                index = themeIndices.get(str(setting('Theme')).lower(), -1)
                 if index >= 0:
                      self.themeBox.setCurrentIndex(index)
 
@@ -1836,13 +2014,13 @@ class PreferencesDialog(QtWidgets.QDialog):
                 L.addWidget(self.preview)
                 L.addWidget(self.description)
                 L.addStretch(1)
-                previewGB = QtWidgets.QGroupBox(globals.trans.string('PrefsDlg', 22))
+                previewGB = QtWidgets.QGroupBox(_tr('PrefsDlg', 22))
                 previewGB.setLayout(L)
 
                 # Create the options box options
-                keys = QtWidgets.QStyleFactory().keys()
+                keys = _styleKeys()
                 self.NonWinStyle = QtWidgets.QComboBox()
-                self.NonWinStyle.setToolTip(globals.trans.string('PrefsDlg', 24))
+                self.NonWinStyle.setToolTip(_tr('PrefsDlg', 24))
                 self.NonWinStyle.addItems(keys)
                 uistyle = setting('uiStyle', "Fusion")
                 if uistyle is not None:
@@ -1851,7 +2029,7 @@ class PreferencesDialog(QtWidgets.QDialog):
                 # Create the options groupbox
                 L = QtWidgets.QVBoxLayout()
                 L.addWidget(self.NonWinStyle)
-                optionsGB = QtWidgets.QGroupBox(globals.trans.string('PrefsDlg', 25))
+                optionsGB = QtWidgets.QGroupBox(_tr('PrefsDlg', 25))
                 optionsGB.setLayout(L)
 
                 # Create a main layout
@@ -1863,23 +2041,36 @@ class PreferencesDialog(QtWidgets.QDialog):
                 self.setLayout(Layout)
 
                 # Update the preview things
+                self.previewKey = None
                 self.UpdatePreview()
 
-            @property
-            def getAvailableThemes(self):
-                """Searches the Themes folder and returns a list of theme filepaths.
-                Automatically adds 'Classic' to the list."""
-                themes = os.listdir(globals.miyamoto_path + '/miyamotodata/themes')
-                themeList = [('Classic', MiyamotoTheme())]
-                for themeName in themes:
-                    if os.path.isdir(globals.miyamoto_path + '/miyamotodata/themes/' + themeName):
-                        try:
-                            theme = MiyamotoTheme(themeName)
-                            themeList.append((themeName, theme))
-                        except Exception:
-                            pass
-
-                return tuple(themeList)
+            @classmethod
+            def getAvailableThemes(cls):
+                """Returns the names of the available themes."""
+                return _availableThemes()
+
+            def loadTheme(self, name):
+                """
+                Loads a theme the first time it's previewed. Returns None and
+                removes it from the theme box if it's broken.
+                """
+                if name in self.loadedThemes:
+                    return self.loadedThemes[name]
+
+                try:
+                    themeObj = MiyamotoTheme(name)
+                except Exception:
+                    themeObj = None
+
+                    # Never offer a theme that can't be loaded
+                    index = self.themeBox.findText(name)
+                    self.themeBox.blockSignals(True)
+                    self.themeBox.removeItem(index)
+                    self.themeBox.setCurrentIndex(0)
+                    self.themeBox.blockSignals(False)
+
+                self.loadedThemes[name] = themeObj
+                return themeObj
 
             def UpdatePreview(self):
                 """
@@ -1888,8 +2079,20 @@ class PreferencesDialog(QtWidgets.QDialog):
                 theme = self.themeBox.currentText()
                 style = self.NonWinStyle.currentText()
 
-                themeObj = MiyamotoTheme(theme)
-                keys = QtWidgets.QStyleFactory().keys()
+                # Nothing to do if neither the theme nor the style changed
+                if (theme, style) == self.previewKey:
+                    return
+
+                themeObj = self.loadTheme(theme)
+                if themeObj is None:
+                    # Broken theme, fall back to Classic
+                    theme = self.themeBox.currentText()
+                    if (theme, style) == self.previewKey:
+                        return
+
+                    themeObj = self.loadTheme(theme)
+
+                keys = list(_styleKeys())
 
                 if themeObj.color('ui') is not None and not themeObj.forceStyleSheet:
                     styles = ["WindowsXP", "WindowsVista"]
@@ -1905,18 +2108,28 @@ class PreferencesDialog(QtWidgets.QDialog):
                 self.NonWinStyle.addItems(keys)
                 self.NonWinStyle.setCurrentIndex(keys.index(style))
 
-                for name, themeObj in self.themes:
-                    if name == self.themeBox.currentText():
-                        t = themeObj
-                        self.preview.setPixmap(self.drawPreview(t))
-                        text = globals.trans.string('PrefsDlg', 26, '[name]', t.themeName, '[creator]', t.creator,
-                                            '[description]', t.description)
-                        self.description.setText(text)
+                self.previewKey = (theme, style)
+
+                self.preview.setPixmap(self.drawPreview(themeObj))
+                text = _tr('PrefsDlg', 26, '[name]', themeObj.themeName, '[creator]', themeObj.creator,
+                           '[description]', themeObj.description)
+                self.description.setText(text)
 
             def drawPreview(self, theme):
                 """
                 Returns a preview pixmap for the given theme
                 """
+                # The preview only depends on the theme colors
+                key = tuple(theme.color(name).rgba() for name in ThemePreviewColors)
+                if key not in _themePreviewCache:
+                    _themePreviewCache[key] = self.renderPreview(theme)
+
+                return _themePreviewCache[key]
+
+            def renderPreview(self, theme):
+                """
+                Draws a preview pixmap for the given theme
+                """
 
                 tilewidth = 24
                 width = int(21.875 * tilewidth)
@@ -1928,65 +2141,65 @@ class PreferencesDialog(QtWidgets.QDialog):
 
                 paint = QtGui.QPainter(px)
 
-                font = QtGui.QFont(globals.NumberFont) # need to make a new instance to avoid changing global settings
-                font.setPointSize(6)
-                paint.setFont(font)
+                paint.setFont(_numberFont(6))
+
+                spriteboxPath, entrancePath, locationPath, zonePath, zoneCornerPath = _themePreviewPaths(tilewidth)
 
                 # Draw the spriteboxes
                 paint.setPen(QtGui.QPen(theme.color('spritebox_lines'), 1))
                 paint.setBrush(QtGui.QBrush(theme.color('spritebox_fill')))
 
-                paint.drawRoundedRect(11 * tilewidth, 4 * tilewidth, tilewidth, tilewidth, 5, 5)
+                paint.drawPath(spriteboxPath)
                 paint.drawText(QtCore.QPointF(11.25 * tilewidth, 4.6875 * tilewidth), '38')
-
-                paint.drawRoundedRect(tilewidth, 6 * tilewidth, tilewidth, tilewidth, 5, 5)
                 paint.drawText(QtCore.QPointF(1.25 * tilewidth, 6.6875 * tilewidth), '53')
 
                 # Draw the entrance
                 paint.setPen(QtGui.QPen(theme.color('entrance_lines'), 1))
                 paint.setBrush(QtGui.QBrush(theme.color('entrance_fill')))
 
-                paint.drawRoundedRect(13 * tilewidth, 8 * tilewidth, tilewidth, tilewidth, 5, 5)
+                paint.drawPath(entrancePath)
                 paint.drawText(QtCore.QPointF(13.25 * tilewidth, 8.625 * tilewidth), '0')
 
                 # Draw the location
                 paint.setPen(QtGui.QPen(theme.color('location_lines'), 1))
                 paint.setBrush(QtGui.QBrush(theme.color('location_fill')))
 
-                paint.drawRect(tilewidth, 9 * tilewidth, 6 * tilewidth, 2 * tilewidth)
+                paint.drawPath(locationPath)
                 paint.setPen(QtGui.QPen(theme.color('location_text'), 1))
                 paint.drawText(QtCore.QPointF(1.25 * tilewidth, 9.625 * tilewidth), '1')
 
                 # Draw the zone
                 paint.setPen(QtGui.QPen(theme.color('zone_lines'), 3))
-                paint.setBrush(QtGui.QBrush(toQColor(0, 0, 0, 0)))
-                paint.drawRect(8.5 * tilewidth, 3.25 * tilewidth, 16 * tilewidth, 7.5 * tilewidth)
-                paint.setPen(QtGui.QPen(theme.color('zone_corner'), 3))
-                paint.setBrush(QtGui.QBrush(theme.color('zone_corner'), 3))
-                paint.drawRect(8.4375 * tilewidth, 3.1875 * tilewidth, 0.125 * tilewidth, 0.125 * tilewidth)
-                paint.drawRect(8.4375 * tilewidth, 10.6875 * tilewidth, 0.125 * tilewidth, 0.125 * tilewidth)
+                paint.setBrush(Qt.NoBrush)
+                paint.drawPath(zonePath)
+                cornerColor = theme.color('zone_corner')
+                paint.setPen(QtGui.QPen(cornerColor, 3))
+                paint.setBrush(QtGui.QBrush(cornerColor, 3))
+                paint.drawPath(zoneCornerPath)
                 paint.setPen(QtGui.QPen(theme.color('zone_text'), 1))
-                font = QtGui.QFont(globals.NumberFont)
-                font.setPointSize(5 / 16 * tilewidth)
-                paint.setFont(font)
+                paint.setFont(_numberFont(5 / 16 * tilewidth))
                 paint.drawText(QtCore.QPointF(8.75 * tilewidth, 3.875 * tilewidth), 'Zone 1')
 
                 # Draw the grid
-                paint.setPen(QtGui.QPen(theme.color('grid'), 1, Qt.DotLine))
-                gridcoords = [i for i in range(0, width, tilewidth)]
-                for i in gridcoords:
-                    paint.setPen(QtGui.QPen(theme.color('grid'), 0.75, Qt.DotLine))
+                gridColor = theme.color('grid')
+                thinPen = QtGui.QPen(gridColor, 0.75, Qt.DotLine)
+                midPen = QtGui.QPen(gridColor, 1.5, Qt.DotLine)
+                thickPen = QtGui.QPen(gridColor, 2.25, Qt.DotLine)
+                quarter = tilewidth // 4
+                half = tilewidth // 2
+
+                gridcoords = range(0, width, tilewidth)
+                for tile, i in enumerate(gridcoords):
+                    # Only draw each line once, with the thickest pen it needs
+                    if not tile % half:
+                        paint.setPen(thickPen)
+                    elif not tile % quarter:
+                        paint.setPen(midPen)
+                    else:
+                        paint.setPen(thinPen)
+
                     paint.drawLine(i, 0, i, height)
                     paint.drawLine(0, i, width, i)
-                    if not (i / tilewidth) % (tilewidth / 4):
-                        paint.setPen(QtGui.QPen(theme.color('grid'), 1.5, Qt.DotLine))
-                        paint.drawLine(i, 0, i, height)
-                        paint.drawLine(0, i, width, i)
-
-                    if not (i / tilewidth) % (tilewidth / 2):
-                        paint.setPen(QtGui.QPen(theme.color('grid'), 2.25, Qt.DotLine))
-                        paint.drawLine(i, 0, i, height)
-                        paint.drawLine(0, i, width, i)
 
                 # Delete the painter and return the pixmap
                 paint.end()
@@ -2019,14 +2232,19 @@ class ChooseLevelNameDialog(QtWidgets.QDialog):
         tree.itemActivated.connect(self.HandleItemActivated)
 
         # add items (globals.LevelNames is effectively a big category)
+        tree.setUpdatesEnabled(False)
+        tree.blockSignals(True)
         tree.addTopLevelItems(self.ParseCategory(globals.LevelNames))
+        tree.blockSignals(False)
+        tree.setUpdatesEnabled(True)
 
         # assign it to self.leveltree
         self.leveltree = tree
 
         # create the buttons
         self.buttonBox = QtWidgets.QDialogButtonBox(QtWidgets.QDialogButtonBox.Ok | QtWidgets.QDialogButtonBox.Cancel)
-        self.buttonBox.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(False)
+        self.okButton = self.buttonBox.button(QtWidgets.QDialogButtonBox.Ok)
+        self.okButton.setEnabled(False)
 
         self.buttonBox.accepted.connect(self.accept)
         self.buttonBox.rejected.connect(self.reject)
@@ -2042,38 +2260,34 @@ class ChooseLevelNameDialog(QtWidgets.QDialog):
         self.setMinimumWidth(320)  # big enough to fit "World 5: Freezeflame Volcano/Freezeflame Glacier"
         self.setMinimumHeight(384)
 
-    def ParseCategory(self, items):
+    def ParseCategory(self, items, parent=None):
         """
-        Parses a XML category
+        Parses a XML category, creating the nodes as children of parent
+        (if given) and returning them
         """
         nodes = []
-        for item in items:
-            node = QtWidgets.QTreeWidgetItem()
-            node.setText(0, item[0])
+        for name, contents in items:
+            node = QtWidgets.QTreeWidgetItem() if parent is None else QtWidgets.QTreeWidgetItem(parent)
+            node.setText(0, name)
             # see if it's a category or a level
-            if isinstance(item[1], str):
+            if isinstance(contents, str):
                 # it's a level
-                node.setData(0, Qt.UserRole, item[1])
-                node.setToolTip(0, item[1])
+                node.setData(0, Qt.UserRole, contents)
+                node.setToolTip(0, contents)
             else:
                 # it's a category
-                children = self.ParseCategory(item[1])
-                for cnode in children:
-                    node.addChild(cnode)
-                node.setToolTip(0, item[0])
+                self.ParseCategory(contents, node)
+                node.setToolTip(0, name)
             nodes.append(node)
-        return tuple(nodes)
+        return nodes
 
     def HandleItemChange(self, current, previous):
         """
         Catch the selected level and enable/disable OK button as needed
         """
-        self.currentlevel = current.data(0, Qt.UserRole)
-        if self.currentlevel is None:
-            self.buttonBox.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(False)
-        else:
-            self.buttonBox.button(QtWidgets.QDialogButtonBox.Ok).setEnabled(True)
-            self.currentlevel = str(self.currentlevel)
+        data = current.data(0, Qt.UserRole)
+        self.currentlevel = None if data is None else str(data)
+        self.okButton.setEnabled(data is not None)
 
     def HandleItemActivated(self, item, column):
         """
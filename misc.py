@@ -27,6 +27,8 @@
 
 ############ Imports ############
 
+import re
+
 from PyQt5 import QtCore, QtGui, QtWidgets
 Qt = QtCore.Qt
 
@@ -620,6 +622,40 @@ def clipStr(text, idealWidth, font=None):
     return text
 
 
+NumberSplitter = re.compile(r'(\d+)')
+
+
+def naturalSortKey(text):
+    """
+    Sort key for "Natural sorting" (opposite of "Lexicographic sorting")
+    """
+    return [int(t) if t.isdigit() else t.lower() for t in NumberSplitter.split(text)]
+
+
+def decodeClipObject(split):
+    """
+    Decodes an object entry of a MiyamotoClip, already split on ':', into
+    (tileset, type, layer, objx, objy, width, height, data). Returns None
+    if the entry fails the sanity checks, and raises ValueError if a field
+    isn't a number.
+    """
+    if len(split) != 9: return None
+
+    tileset, type, layer, objx, objy, width, height, data = map(int, split[1:])
+
+    # basic sanity checks
+    if tileset < 0 or tileset > 3: return None
+    if type < 0 or type > 255: return None
+    if layer < 0 or layer > 2: return None
+    if objx < 0 or objx > 1023: return None
+    if objy < 0 or objy > 511: return None
+    if width < 1 or width > 1023: return None
+    if height < 1 or height > 511: return None
+    if data < 0 or data > 24: return None
+
+    return tileset, type, layer, objx, objy, width, height, data
+
+
 def setting(name, default=None):
     """
     Thin wrapper around QSettings, fixes the type=bool bug
@@ -1215,7 +1215,7 @@ class MiyamotoWindow(QtWidgets.QMainWindow):
 
         else:
             folders = os.listdir(top_folder)
-            folders.sort(key=lambda s: [int(t) if t.isdigit() else t.lower() for t in re.split(r'(\d+)', s)])
+            folders.sort(key=naturalSortKey)
 
             folders_ = [folder for folder in folders if os.path.isdir(top_folder + "/" + folder)]
             del folders
@@ -1568,19 +1568,19 @@ class MiyamotoWindow(QtWidgets.QMainWindow):
         Moves the Overview current position box based on X scroll bar value
         """
         self.levelOverview.Xposlocator = pos
-        self.levelOverview.update()
+        self.levelOverview.updateLocator()
 
     def YScrollChange(self, pos):
         """
         Moves the Overview current position box based on Y scroll bar value
         """
         self.levelOverview.Yposlocator = pos
-        self.levelOverview.update()
+        self.levelOverview.updateLocator()
 
     def HandleWindowSizeChange(self, w, h):
         self.levelOverview.Hlocator = h
         self.levelOverview.Wlocator = w
-        self.levelOverview.update()
+        self.levelOverview.updateLocator()
 
     def UpdateTitle(self):
         """
@@ -2217,26 +2217,10 @@ class MiyamotoWindow(QtWidgets.QMainWindow):
                 split = item.split(':')
                 if split[0] == '0':
                     # object
-                    if len(split) != 9: continue
-
-                    tileset = int(split[1])
-                    type = int(split[2])
-                    layer = int(split[3])
-                    objx = int(split[4])
-                    objy = int(split[5])
-                    width = int(split[6])
-                    height = int(split[7])
-                    data = int(split[8])
-
-                    # basic sanity checks
-                    if tileset < 0 or tileset > 3: continue
-                    if type < 0 or type > 255: continue
-                    if layer < 0 or layer > 2: continue
-                    if objx < 0 or objx > 1023: continue
-                    if objy < 0 or objy > 511: continue
-                    if width < 1 or width > 1023: continue
-                    if height < 1 or height > 511: continue
-                    if data < 0 or data > 24: continue
+                    fields = decodeClipObject(split)
+                    if fields is None: continue
+
+                    tileset, type, layer, objx, objy, width, height, data = fields
 
                     newitem = ObjectItem(tileset, type, layer, objx, objy, width, height, 1, data)
 
@@ -2722,7 +2706,7 @@ class MiyamotoWindow(QtWidgets.QMainWindow):
         self.folderPicker.clear()
 
         folders = os.listdir(path)
-        folders.sort(key=lambda s: [int(t) if t.isdigit() else t.lower() for t in re.split(r'(\d+)', s)])
+        folders.sort(key=naturalSortKey)
 
         folders_ = [folder for folder in folders if os.path.isdir(path + "/" + folder)]
         del folders
@@ -2768,19 +2752,21 @@ class MiyamotoWindow(QtWidgets.QMainWindow):
         globals.modifyInnerName = dlg.generalTab.modifyInnerName.isChecked()
         setSetting('ModifyInnerName', globals.modifyInnerName)
 
-        # Get the Toolbar tab settings
-        boxes = (
-        dlg.toolbarTab.FileBoxes, dlg.toolbarTab.EditBoxes, dlg.toolbarTab.ViewBoxes, dlg.toolbarTab.SettingsBoxes,
-        dlg.toolbarTab.HelpBoxes)
-        ToolbarSettings = {}
-        for boxList in boxes:
-            for box in boxList:
-                ToolbarSettings[box.InternalName] = box.isChecked()
-        setSetting('ToolbarActs', ToolbarSettings)
+        # Get the Toolbar tab settings (if the tab was never opened, they're unchanged)
+        if dlg.toolbarTabBuilt:
+            boxes = (
+            dlg.toolbarTab.FileBoxes, dlg.toolbarTab.EditBoxes, dlg.toolbarTab.ViewBoxes, dlg.toolbarTab.SettingsBoxes,
+            dlg.toolbarTab.HelpBoxes)
+            ToolbarSettings = {}
+            for boxList in boxes:
+                for box in boxList:
+                    ToolbarSettings[box.InternalName] = box.isChecked()
+            setSetting('ToolbarActs', ToolbarSettings)
 
         # Get the theme settings
-        setSetting('Theme', dlg.themesTab.themeBox.currentText())
-        setSetting('uiStyle', dlg.themesTab.NonWinStyle.currentText())
+        if dlg.themesTabBuilt:
+            setSetting('Theme', dlg.themesTab.themeBox.currentText())
+            setSetting('uiStyle', dlg.themesTab.NonWinStyle.currentText())
 
         # Warn the user that they may need to restart
         QtWidgets.QMessageBox.warning(None, globals.trans.string('PrefsDlg', 0), globals.trans.string('PrefsDlg', 30))
@@ -3412,7 +3398,7 @@ class MiyamotoWindow(QtWidgets.QMainWindow):
         Handle position changes from the level overview
         """
         self.view.centerOn(x, y)
-        self.levelOverview.update()
+        self.levelOverview.updateLocator()
 
     def SaveComments(self):
         """
@@ -3757,7 +3743,7 @@ class MiyamotoWindow(QtWidgets.QMainWindow):
                 self.folderPicker.clear()
 
                 folders = os.listdir(top_folder)
-                folders.sort(key=lambda s: [int(t) if t.isdigit() else t.lower() for t in re.split(r'(\d+)', s)])
+                folders.sort(key=naturalSortKey)
 
                 folders_ = [folder for folder in folders if os.path.isdir(top_folder + "/" + folder)]
                 del folders
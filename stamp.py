@@ -27,10 +27,13 @@
 
 ############ Imports ############
 
+import hashlib
+
 from PyQt5 import QtCore, QtGui, QtWidgets
 Qt = QtCore.Qt
 
 import globals
+import spritelib as SLib
 
 #################################
 
@@ -181,13 +184,34 @@ class Stamp:
         # Return it
         return pix
 
+    def cachedPreview(self):
+        """
+        Returns the stamp preview from the pixmap cache, only rendering it if
+        the same stamp hasn't been rendered with the current tiles and sprite
+        images yet
+        """
+        # The cache keys of the tile images change whenever their contents do
+        tileKeys = [None if tile is None or tile.main is None else tile.main.cacheKey() for tile in globals.Tiles or ()]
+
+        key = hashlib.blake2b(self.MiyamotoClip.encode('utf-8'), digest_size=8)
+        key.update(repr(tileKeys).encode('utf-8'))
+        key.update(repr(sorted(SLib.SpriteImagesLoaded)).encode('utf-8'))
+        key = 'stamp:' + key.hexdigest()
+
+        pix = QtGui.QPixmapCache.find(key)
+        if pix is None or pix.isNull():
+            pix = self.renderPreview()
+            QtGui.QPixmapCache.insert(key, pix)
+
+        return pix
+
     def render(self):
         """
         Renders the stamp icon, preview AND text
         """
 
         # Get the preview icon
-        prevIcon = self.renderPreview()
+        prevIcon = self.cachedPreview()
 
         # Calculate the total size of the icon
         textSize = self.calculateTextSize(self.Name)
@@ -287,26 +311,25 @@ class StampListModel(QtCore.QAbstractListModel):
         """
         Adds a stamp
         """
+        row = len(self.items)
 
-        # Start resetting
-        self.beginResetModel()
+        # Only the new row has to be laid out
+        self.beginInsertRows(QtCore.QModelIndex(), row, row)
 
         # Add the stamp to self.items
         self.items.append(stamp)
 
-        # Finish resetting
-        self.endResetModel()
+        self.endInsertRows()
 
     def removeStamp(self, stamp):
         """
         Removes a stamp
         """
+        row = self.items.index(stamp)
 
-        # Start resetting
-        self.beginResetModel()
+        self.beginRemoveRows(QtCore.QModelIndex(), row, row)
 
         # Remove the stamp from self.items
-        self.items.remove(stamp)
+        del self.items[row]
 
-        # Finish resetting
-        self.endResetModel()
+        self.endRemoveRows()
@@ -69,6 +69,13 @@ def SetDirty(noautosave=False):
     if globals.DirtyOverride > 0: return
 
     if not noautosave: globals.AutoSaveDirty = True
+
+    # Every edit goes through here, so re-render the overview
+    try:
+        globals.mainWindow.levelOverview.update()
+    except Exception:
+        pass
+
     if globals.Dirty: return
 
     globals.Dirty = True
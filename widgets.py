@@ -27,10 +27,11 @@
 
 ############ Imports ############
 
+import functools
+import itertools
 import json
 from math import sqrt
 import os
-import re
 import struct
 import sys
 
@@ -47,7 +48,7 @@ from items import CommentItem
 # from loading import LoadSpriteData, LoadSpriteListData
 # from loading import LoadSpriteCategories, LoadEntranceNames
 
-from misc import clipStr, setting, setSetting, drawForegroundGrid
+from misc import clipStr, decodeClipObject, naturalSortKey, setting, setSetting, drawForegroundGrid
 from stamp import StampListModel
 
 from tileset import TilesetTile, ObjectDef, objFitsInTileset
@@ -58,6 +59,54 @@ from tileset import RenderObjectAll, ProcessOverrides, SimpleTilesetNames
 from ui import createHorzLine, createVertLine, GetIcon
 from verifications import SetDirty
 
+if globals.cython_available:
+    from zonesnap_cy import SnapRectToGrid
+else:
+    from zonesnap import SnapRectToGrid
+
+# Header of an exported object's meta file: offset, width, height, random byte
+ObjectIndexStruct = struct.Struct('>HBBH')
+
+
+@functools.lru_cache(maxsize=256)
+def _clipObjectTypes(encoded):
+    """
+    Returns the set of (tileset, type) pairs of the objects in a MiyamotoClip
+    """
+    types = set()
+
+    if not (encoded.startswith('MiyamotoClip|') and encoded.endswith('|%')):
+        return frozenset(types)
+
+    try:
+        for item in encoded[13:-2].split('|'):
+            split = item.split(':')
+            if split[0] != '0': continue
+
+            fields = decodeClipObject(split)
+            if fields is None: continue
+
+            types.add((fields[0], fields[1]))
+
+    except ValueError:
+        # an int() probably failed somewhere
+        pass
+
+    return frozenset(types)
+
+
+def _scaleObjectPreview(img, tileWidth):
+    """
+    Scales a QImage object preview to the size shown in the object picker
+    (32 pixels per tile, at most 256x256) in a single pass
+    """
+    width = min(int(img.width() * 32 / tileWidth), 256)
+
+    if img.height() * width > 256 * img.width():
+        return img.scaledToHeight(256, Qt.SmoothTransformation)
+
+    return img.scaledToWidth(width, Qt.SmoothTransformation)
+
 #################################
 
 
@@ -82,6 +131,12 @@ class LevelOverviewWidget(QtWidgets.QWidget):
         self.spritebrush = QtGui.QBrush(globals.theme.color('overview_sprite'))
         self.entrancebrush = QtGui.QBrush(globals.theme.color('overview_entrance'))
         self.locationbrush = QtGui.QBrush(globals.theme.color('overview_location_fill'))
+        self.zonepen = QtGui.QPen(globals.theme.color('overview_zone_lines'), 1)
+        self.locationpen = QtGui.QPen(globals.theme.color('overview_location_lines'), 1)
+        self.viewpen = QtGui.QPen(globals.theme.color('overview_viewbox'), 1)
+
+        # Rendered level contents; everything but the view locator
+        self.overviewCache = None
 
         self.Reset()
 
@@ -98,6 +153,26 @@ class LevelOverviewWidget(QtWidgets.QWidget):
         self.CalcSize()
         self.Rescale()
 
+    def update(self, *args):
+        """
+        Schedules a repaint, re-rendering the level contents
+        """
+        self.overviewCache = None
+        super().update(*args)
+
+    def updateLocator(self):
+        """
+        Schedules a repaint for a view locator change only
+        """
+        super().update()
+
+    def resizeEvent(self, event):
+        """
+        Handles the widget being resized
+        """
+        self.overviewCache = None
+        super().resizeEvent(event)
+
     def mouseMoveEvent(self, event):
         """
         Handles mouse movement over the widget
@@ -125,85 +200,107 @@ class LevelOverviewWidget(QtWidgets.QWidget):
             # the level is created, but before it's loaded
             return
 
+        if self.overviewCache is None:
+            self.overviewCache = self.renderOverview()
+
         painter = QtGui.QPainter(self)
-        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
+        painter.drawPixmap(0, 0, self.overviewCache)
 
-        self.Reset()
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, True)
         painter.scale(self.scale, self.scale)
-        painter.fillRect(0, 0, 1024, 512, self.bgbrush)
+        painter.setPen(self.viewpen)
 
-        dr = painter.drawRect
-        fr = painter.fillRect
-        transform = QtGui.QTransform() / globals.TileWidth
+        f = 1 / (globals.TileWidth * self.mainWindowScale)
+        painter.drawRect(QtCore.QRectF(self.Xposlocator * f, self.Yposlocator * f,
+                                       self.Wlocator * f, self.Hlocator * f))
 
-        b = self.viewbrush
-        painter.setPen(QtGui.QPen(globals.theme.color('overview_zone_lines'), 1))
+    def renderOverview(self):
+        """
+        Renders the level contents to a pixmap the size of the widget
+        """
+        ratio = self.devicePixelRatioF()
+        pixmap = QtGui.QPixmap(self.size() * ratio)
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.transparent)
 
-        for zone in globals.Area.zones:
-            r = transform.mapRect(zone.sceneBoundingRect())
-            fr(r, b)
-            dr(r)
+        painter = QtGui.QPainter(pixmap)
 
-        b = self.objbrush
+        self.Reset()
 
-        for layer in globals.Area.layers:
-            for obj in layer:
-                fr(obj.LevelRect, b)
+        # Antialiasing only pays off once a tile is a few pixels big
+        painter.setRenderHint(QtGui.QPainter.Antialiasing, self.scale > 0.25)
+        painter.scale(self.scale, self.scale)
+        painter.fillRect(0, 0, 1024, 512, self.bgbrush)
 
-        b = self.spritebrush
+        # Nothing extends past maxX/maxY, so only items above or left of
+        # the origin can be off the overview; skip those, if there are any
+        if self.minX < 0 or self.minY < 0:
+            def visible(rects):
+                return [r for r in rects if r.right() >= 0 and r.bottom() >= 0]
+        else:
+            def visible(rects):
+                return rects
 
-        for sprite in globals.Area.sprites:
-            fr(sprite.LevelRect, b)
+        # Draw each kind of item with one batched drawRects call
+        painter.setPen(self.zonepen)
+        painter.setBrush(self.viewbrush)
+        painter.drawRects(visible(self.zoneRects))
 
-        b = self.entrancebrush
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(self.objbrush)
+        painter.drawRects(visible(self.objRects))
 
-        for ent in globals.Area.entrances:
-            fr(ent.LevelRect, b)
+        painter.setBrush(self.spritebrush)
+        painter.drawRects(visible(self.spriteRects))
 
-        b = self.locationbrush
-        painter.setPen(QtGui.QPen(globals.theme.color('overview_location_lines'), 1))
+        painter.setBrush(self.entrancebrush)
+        painter.drawRects(visible(self.entranceRects))
 
-        for location in globals.Area.locations:
-            r = transform.mapRect(location.sceneBoundingRect())
-            fr(r, b)
-            dr(r)
+        painter.setPen(self.locationpen)
+        painter.setBrush(self.locationbrush)
+        painter.drawRects(visible(self.locationRects))
 
-        painter.setPen(QtGui.QPen(globals.theme.color('overview_viewbox'), 1))
-        painter.drawRect(self.Xposlocator / globals.TileWidth / self.mainWindowScale,
-                         self.Yposlocator / globals.TileWidth / self.mainWindowScale,
-                         self.Wlocator / globals.TileWidth / self.mainWindowScale,
-                         self.Hlocator / globals.TileWidth / self.mainWindowScale)
+        painter.end()
+        return pixmap
 
     def CalcSize(self):
         """
         Calculates all the required sizes for this scale
         """
         if not globals.Area:
+            self.minX = self.minY = 0
             self.maxX = 0
             self.maxY = 0
+            self.zoneRects = []
+            self.objRects = []
+            self.spriteRects = []
+            self.entranceRects = []
+            self.locationRects = []
             return
 
+        # The item rects in tile units are collected once here, and
+        # reused by renderOverview
         transform = QtGui.QTransform() / globals.TileWidth
-        rect = QtCore.QRectF()
-
-        for zone in globals.Area.zones:
-            rect |= transform.mapRect(zone.sceneBoundingRect())
-
-        for layer in globals.Area.layers:
-            for obj in layer:
-                rect |= obj.LevelRect
-
-        for sprite in globals.Area.sprites:
-            rect |= sprite.LevelRect
-
-        for ent in globals.Area.entrances:
-            rect |= ent.LevelRect
-
-        for location in globals.Area.locations:
-            rect |= transform.mapRect(location.sceneBoundingRect())
-
-        self.maxX = rect.right()
-        self.maxY = rect.bottom()
+        self.zoneRects = [transform.mapRect(zone.sceneBoundingRect()) for zone in globals.Area.zones]
+        self.objRects = [obj.LevelRect for layer in globals.Area.layers for obj in layer]
+        self.spriteRects = [sprite.LevelRect for sprite in globals.Area.sprites]
+        self.entranceRects = [ent.LevelRect for ent in globals.Area.entrances]
+        self.locationRects = [transform.mapRect(location.sceneBoundingRect()) for location in globals.Area.locations]
+
+        # Find the edges directly instead of building up a united
+        # QRectF (which ignores null rects, so these do too), reading
+        # each rect's coordinates with a single call
+        coords = [r.getCoords() for r in itertools.chain(
+            self.zoneRects, self.objRects, self.spriteRects, self.entranceRects, self.locationRects,
+        ) if not r.isNull()]
+
+        if coords:
+            lefts, tops, rights, bottoms = zip(*coords)
+            self.minX, self.minY = min(lefts), min(tops)
+            self.maxX, self.maxY = max(rights), max(bottoms)
+        else:
+            self.minX = self.minY = 0
+            self.maxX = self.maxY = 0
 
     def Rescale(self):
         """
@@ -348,15 +445,13 @@ class ObjectPickerWidget(QtWidgets.QListView):
             colls = inf.read()
 
         # Get the object's definition
-        indexstruct = struct.Struct('>HBBH')
-
-        data = indexstruct.unpack_from(indexfile, 0)
+        _, width, height, randByte = ObjectIndexStruct.unpack_from(indexfile, 0)
         obj = ObjectDef()
-        obj.width = data[1]
-        obj.height = data[2]
+        obj.width = width
+        obj.height = height
 
         if "randLen" in jsonData:
-            obj.randByte = data[3]
+            obj.randByte = randByte
 
         else:
             obj.randByte = 0
@@ -392,9 +487,10 @@ class ObjectPickerWidget(QtWidgets.QListView):
         globals.ObjectDefinitions[idx][objNum] = obj
 
         # Update all instances of the replaced object in the scene
-        for obj in globals.mainWindow.scene.items():
-            if isinstance(obj, ObjectItem) and obj.tileset == idx and obj.type == objNum:
-                obj.update()
+        for layer in globals.Area.layers:
+            for obj in layer:
+                if obj.tileset == idx and obj.type == objNum:
+                    obj.update()
 
         # Set related flags
         HandleTilesetEdited()
@@ -432,16 +528,9 @@ class ObjectPickerWidget(QtWidgets.QListView):
             return
 
         ## Check if the object is used as a stamp
-        usedAsStamp = False
-        for stamp in globals.mainWindow.stampChooser.model.items:
-            layers, _ = globals.mainWindow.getEncodedObjects(stamp.MiyamotoClip, False)
-            for layer in layers:
-                for obj in layer:
-                    if obj.tileset == idx and obj.type == objNum:
-                        usedAsStamp = True
-                        break
-                if usedAsStamp: break
-            if usedAsStamp: break
+        key = (idx, objNum)
+        usedAsStamp = any(key in _clipObjectTypes(stamp.MiyamotoClip)
+                          for stamp in globals.mainWindow.stampChooser.model.items)
 
         if usedAsStamp:
             dlgTxt = "You can't delete this object because it is used as a stamp."
@@ -451,17 +540,8 @@ class ObjectPickerWidget(QtWidgets.QListView):
             return
 
         ## Check if the object is in the clipboard
-        inClipboard = False
-        if globals.mainWindow.clipboard is not None:
-            if globals.mainWindow.clipboard.startswith('MiyamotoClip|') and globals.mainWindow.clipboard.endswith('|%'):
-                layers, _ = globals.mainWindow.getEncodedObjects(globals.mainWindow.clipboard, False)
-                for layer in layers:
-                    for obj in layer:
-                        if obj.tileset == idx and obj.type == objNum:
-                            inClipboard = True
-                            break
-                    if inClipboard:
-                        break
+        clipboard = globals.mainWindow.clipboard
+        inClipboard = clipboard is not None and key in _clipObjectTypes(clipboard)
 
         if inClipboard:
             dlgTxt = "You can't delete this object because it is in the clipboard."
@@ -523,14 +603,20 @@ class ObjectPickerWidget(QtWidgets.QListView):
         if result != QtWidgets.QMessageBox.Yes:
             return
 
-        for obj in matchingObjs:
-            obj.delete()
-            obj.setSelected(False)
-            globals.mainWindow.scene.removeItem(obj)
-            globals.mainWindow.levelOverview.update()
-            del obj
-
-        globals.mainWindow.scene.update()
+        # Remove them all with the scene's signals blocked, so the selection
+        # handler runs once at the end rather than once per removed object
+        scene = globals.mainWindow.scene
+        scene.blockSignals(True)
+        try:
+            for obj in matchingObjs:
+                obj.delete()
+                obj.setSelected(False)
+                scene.removeItem(obj)
+        finally:
+            scene.blockSignals(False)
+
+        scene.update()
+        globals.mainWindow.levelOverview.update()
         SetDirty()
         globals.mainWindow.SelectionUpdateFlag = False
         globals.mainWindow.ChangeSelectionHandler()
@@ -576,6 +662,9 @@ class ObjectPickerWidget(QtWidgets.QListView):
             self.ritems = []
             self.itemsize = []
 
+            # Scaled previews from the last load, by what they were drawn from
+            self.previewCache = {}
+
             for i in range(256):
                 self.items.append(None)
                 self.ritems.append(None)
@@ -629,6 +718,14 @@ class ObjectPickerWidget(QtWidgets.QListView):
             else:
                 numTileset = [idx]
 
+            tiles = globals.Tiles
+            tileWidth = globals.TileWidth
+            animatedTiles = {i for i, tile in enumerate(tiles) if isinstance(tile, TilesetTile) and tile.isAnimated}
+
+            # Only keep the previews that are still in use
+            oldPreviewCache = self.previewCache
+            self.previewCache = {}
+
             for idx in numTileset:
                 if globals.ObjectDefinitions[idx] is None:
                     globals.numObj.append(z)
@@ -643,34 +740,50 @@ class ObjectPickerWidget(QtWidgets.QListView):
                     obj = RenderObject(idx, i, defs[i].width, defs[i].height, True)
                     self.items.append(obj)
 
-                    pm = QtGui.QPixmap(defs[i].width * globals.TileWidth, defs[i].height * globals.TileWidth)
-                    pm.fill(Qt.transparent)
-                    p = QtGui.QPainter()
-                    p.begin(pm)
-                    y = 0
+                    # Find the tile images the preview is drawn from, walking
+                    # the rendered rows as one flat list of width-long rows
+                    width = defs[i].width
+                    draws = []
                     isAnim = False
+                    skipRow = -1
+
+                    for n, tile in enumerate(itertools.chain.from_iterable(obj)):
+                        if tile == -1: continue
+                        y, x = divmod(n, width)
+                        if y == skipRow: continue
+                        try:
+                            main = tiles[tile].main
+                        except AttributeError:
+                            # skip the rest of the row
+                            skipRow = y
+                            continue
+                        draws.append((x * tileWidth, y * tileWidth, main))
+                        if tile in animatedTiles: isAnim = True
+
+                    # The cache keys of the images change whenever their contents do
+                    key = (defs[i].width, defs[i].height, tileWidth, tuple(
+                        (x, y, isinstance(main, QtGui.QImage), main.cacheKey()) for x, y, main in draws))
+
+                    pm = oldPreviewCache.get(key)
+                    if pm is None:
+                        # Compose and scale as a QImage, which is what the raster engine draws into
+                        pm = QtGui.QImage(defs[i].width * tileWidth, defs[i].height * tileWidth,
+                                          QtGui.QImage.Format_ARGB32_Premultiplied)
+                        pm.fill(Qt.transparent)
+                        p = QtGui.QPainter()
+                        p.begin(pm)
+
+                        for x, y, main in draws:
+                            if isinstance(main, QtGui.QImage):
+                                p.drawImage(x, y, main)
+                            else:
+                                p.drawPixmap(x, y, main)
 
-                    for row in obj:
-                        x = 0
-                        for tile in row:
-                            if tile != -1:
-                                try:
-                                    if isinstance(globals.Tiles[tile].main, QtGui.QImage):
-                                        p.drawImage(x, y, globals.Tiles[tile].main)
-                                    else:
-                                        p.drawPixmap(x, y, globals.Tiles[tile].main)
-                                except AttributeError:
-                                    break
-                                if isinstance(globals.Tiles[tile], TilesetTile) and globals.Tiles[tile].isAnimated: isAnim = True
-                            x += globals.TileWidth
-                        y += globals.TileWidth
-                    p.end()
-
-                    pm = pm.scaledToWidth(pm.width() * 32 / globals.TileWidth, Qt.SmoothTransformation)
-                    if pm.width() > 256:
-                        pm = pm.scaledToWidth(256, Qt.SmoothTransformation)
-                    if pm.height() > 256:
-                        pm = pm.scaledToHeight(256, Qt.SmoothTransformation)
+                        p.end()
+
+                        pm = QtGui.QPixmap.fromImage(_scaleObjectPreview(pm, tileWidth))
+
+                    self.previewCache[key] = pm
 
                     self.ritems.append(pm)
                     self.itemsize.append(QtCore.QSize(pm.width() + 4, pm.height() + 4))
@@ -712,14 +825,23 @@ class ObjectPickerWidget(QtWidgets.QListView):
             z = 0
             top_folder = os.path.join(setting('ObjPath'), globals.mainWindow.folderPicker.currentText())
 
-            # Get the list of files in the folder
-            files = os.listdir(top_folder)
-            ## Sort the files through "Natural sorting" (opposite of "Lexicographic sorting")
-            files.sort(key=lambda s: [int(t) if t.isdigit() else t.lower() for t in re.split('(\d+)', s)])
+            # Objects often share images, so only load each one once
+            pixmaps = {}
 
-            # Discard files not enging with ".json" from the list
-            files_ = [file for file in files if file[-5:] == ".json"]
-            del files
+            def loadPixmap(path):
+                if path not in pixmaps:
+                    pixmaps[path] = QtGui.QPixmap(path)
+
+                return pixmaps[path]
+
+            # Get the files in the folder, and the list of ".json" ones
+            with os.scandir(top_folder) as entries:
+                fileList = [entry.name for entry in entries if entry.is_file()]
+
+            fileNames = set(fileList)
+            files_ = [file for file in fileList if file[-5:] == ".json"]
+            ## Sort the files through "Natural sorting" (opposite of "Lexicographic sorting")
+            files_.sort(key=naturalSortKey)
 
             for file in files_:
                 dir = top_folder + "/"
@@ -736,7 +858,7 @@ class ObjectPickerWidget(QtWidgets.QListView):
                 # Check for the required files
                 found = True
                 for f in ["colls", "meta", "objlyt", "img", "nml"]:
-                    if not os.path.isfile(dir + jsonData[f]):
+                    if jsonData[f] not in fileNames and not os.path.isfile(dir + jsonData[f]):
                         print("%s not found!" % (dir + jsonData[f]))
                         found = False
                         break
@@ -755,17 +877,15 @@ class ObjectPickerWidget(QtWidgets.QListView):
                     deffile = inf.read()
 
                 # Read the object definition file into Object instances
-                indexstruct = struct.Struct('>HBBH')
-
-                data = indexstruct.unpack_from(indexfile, 0)
+                _, width, height, randByte = ObjectIndexStruct.unpack_from(indexfile, 0)
                 def_ = ObjectDef()
-                def_.width = data[1]
-                def_.height = data[2]
+                def_.width = width
+                def_.height = height
                 def_.folderIndex = globals.mainWindow.folderPicker.currentIndex()
                 def_.objAllIndex = z
 
                 if "randLen" in jsonData:
-                    def_.randByte = data[3]
+                    def_.randByte = randByte
 
                 else:
                     def_.randByte = 0
@@ -778,17 +898,15 @@ class ObjectPickerWidget(QtWidgets.QListView):
                 obj = RenderObjectAll(def_, def_.width, def_.height, True)
                 self.items.append(obj)
 
-                globals.ObjectAllImages.append([QtGui.QPixmap(dir + jsonData["img"]),
-                                        QtGui.QPixmap(dir + jsonData["nml"])])
+                globals.ObjectAllImages.append([loadPixmap(dir + jsonData["img"]),
+                                        loadPixmap(dir + jsonData["nml"])])
 
-                img, nml = globals.ObjectAllImages[-1]
+                img = globals.ObjectAllImages[-1][0]
 
                 # Render said object definition for the preview
+                ## Map each tile used by the object to its position in the image
                 tilesUsed = {}
-                tiles = [None] * def_.width * def_.height
 
-                # Load the tiles of the object for the preview
-                ## Start by creating a TilesetTile instance for each tile
                 if def_.reversed:
                     for crow, row in enumerate(def_.rows):
                         if def_.subPartAt != -1:
@@ -804,8 +922,7 @@ class ObjectPickerWidget(QtWidgets.QListView):
                         for tile in row:
                             if len(tile) == 3:
                                 if tile != [0, 0, 0]:
-                                    tilesUsed[tile[1] & 0x3FF] = y * def_.width + x
-                                    tiles[y * def_.width + x] = TilesetTile(img.copy(x * 60, y * 60, 60, 60), nml.copy(x * 60, y * 60, 60, 60))
+                                    tilesUsed[tile[1] & 0x3FF] = (x * 60, y * 60)
 
                                 x += 1
 
@@ -817,42 +934,40 @@ class ObjectPickerWidget(QtWidgets.QListView):
                         for tile in row:
                             if len(tile) == 3:
                                 if tile != [0, 0, 0]:
-                                    tilesUsed[tile[1] & 0x3FF] = y * def_.width + x
-                                    tiles[y * def_.width + x] = TilesetTile(img.copy(x * 60, y * 60, 60, 60), nml.copy(x * 60, y * 60, 60, 60))
+                                    tilesUsed[tile[1] & 0x3FF] = (x * 60, y * 60)
 
                                 x += 1
 
                 # Start painting the preview
-                pm = QtGui.QPixmap(def_.width * 60, def_.height * 60)
+                pm = QtGui.QImage(def_.width * 60, def_.height * 60, QtGui.QImage.Format_ARGB32_Premultiplied)
                 pm.fill(Qt.transparent)
                 p = QtGui.QPainter()
                 p.begin(pm)
-                y = 0
-
-                for row in obj:
-                    x = 0
-                    for tile in row:
-                        if tile != -1:
-                            if tile in tilesUsed:
-                                p.drawPixmap(x, y, tiles[tilesUsed[tile]].main)
-                            else:
-                                try:
-                                    if isinstance(globals.Tiles[tile].main, QtGui.QImage):
-                                        p.drawImage(x, y, globals.Tiles[tile].main)
-                                    else:
-                                        p.drawPixmap(x, y, globals.Tiles[tile].main)
-                                except AttributeError:
-                                    break
-                        x += 60
-                    y += 60
+                skipRow = -1
+
+                for n, tile in enumerate(itertools.chain.from_iterable(obj)):
+                    if tile == -1: continue
+                    y, x = divmod(n, def_.width)
+                    if y == skipRow: continue
+                    if tile in tilesUsed:
+                        # Draw straight from the object image
+                        sx, sy = tilesUsed[tile]
+                        p.drawPixmap(x * 60, y * 60, img, sx, sy, 60, 60)
+                    else:
+                        try:
+                            main = globals.Tiles[tile].main
+                        except AttributeError:
+                            # skip the rest of the row
+                            skipRow = y
+                            continue
+                        if isinstance(main, QtGui.QImage):
+                            p.drawImage(x * 60, y * 60, main)
+                        else:
+                            p.drawPixmap(x * 60, y * 60, main)
                 p.end()
 
                 # Resize the preview for a good looking layout
-                pm = pm.scaledToWidth(pm.width() * 32 / globals.TileWidth, Qt.SmoothTransformation)
-                if pm.width() > 256:
-                    pm = pm.scaledToWidth(256, Qt.SmoothTransformation)
-                if pm.height() > 256:
-                    pm = pm.scaledToHeight(256, Qt.SmoothTransformation)
+                pm = QtGui.QPixmap.fromImage(_scaleObjectPreview(pm, globals.TileWidth))
 
                 self.ritems.append(pm)
                 self.itemsize.append(QtCore.QSize(pm.width() + 4, pm.height() + 4))
@@ -923,13 +1038,16 @@ class StampChooserWidget(QtWidgets.QListView):
             if option.state & QtWidgets.QStyle.State_Selected:
                 painter.fillRect(option.rect, option.palette.highlight())
 
-            painter.drawPixmap(option.rect.x() + 2, option.rect.y() + 2, index.model().data(index, Qt.DecorationRole))
+            # Read the icon straight off the stamp rather than through data()
+            icon = index.model().items[index.row()].Icon
+            painter.drawPixmap(option.rect.x() + 2, option.rect.y() + 2, icon)
 
         def sizeHint(self, option, index):
             """
             Returns the size for the stamp
             """
-            return index.model().data(index, Qt.DecorationRole).size() + QtCore.QSize(4, 4)
+            icon = index.model().items[index.row()].Icon
+            return QtCore.QSize(icon.width() + 4, icon.height() + 4)
 
     def addStamp(self, stamp):
         """
@@ -974,9 +1092,15 @@ class SpritePickerWidget(QtWidgets.QTreeWidget):
         self.setHeaderHidden(True)
         self.setIndentation(16)
         self.currentItemChanged.connect(self.HandleItemChange)
+        self.itemClicked.connect(self.HandleSprReplace)
 
         import loading
-        loading.LoadSpriteData()
+
+        # the main window has usually parsed the sprite data already,
+        # and unlike the other loaders this one doesn't check for that
+        if globals.Sprites is None:
+            loading.LoadSpriteData()
+
         loading.LoadSpriteListData()
         loading.LoadSpriteCategories()
         del loading
@@ -988,44 +1112,56 @@ class SpritePickerWidget(QtWidgets.QTreeWidget):
         Loads tree widget items
         """
         self.clear()
+        self.SearchIndex = []
+
+        # the same sprite shows up in several views, so only format its label once
+        labels = {}
+
+        # look these up once rather than for every item
+        searchName = globals.trans.string('Sprites', 16)
+        sprites, numSprites = globals.Sprites, globals.NumSprites
+        UserRole = Qt.UserRole
+        TreeItem = QtWidgets.QTreeWidgetItem
 
         for viewname, view, nodelist in globals.SpriteCategories:
-            for n in nodelist: nodelist.remove(n)
+            nodelist.clear()
             for catname, category in view:
-                cnode = QtWidgets.QTreeWidgetItem()
+                cnode = TreeItem()
                 cnode.setText(0, catname)
-                cnode.setData(0, Qt.UserRole, -1)
+                cnode.setData(0, UserRole, -1)
 
-                isSearch = (catname == globals.trans.string('Sprites', 16))
+                isSearch = (catname == searchName)
                 if isSearch:
                     self.SearchResultsCategory = cnode
-                    SearchableItems = []
 
                 for id in category:
-                    snode = QtWidgets.QTreeWidgetItem()
+                    snode = TreeItem()
                     if id == 9999:
                         snode.setText(0, globals.trans.string('Sprites', 17))
-                        snode.setData(0, Qt.UserRole, -2)
+                        snode.setData(0, UserRole, -2)
                         self.NoSpritesFound = snode
                     else:
-                        sdef = globals.Sprites[id] if 0 <= id < globals.NumSprites else None
-                        snode.setText(0, globals.trans.string('Sprites', 18, '[id]', id, '[name]', "UNKNOWN" if sdef is None else sdef.name))
-                        snode.setData(0, Qt.UserRole, id)
+                        label = labels.get(id)
+                        if label is None:
+                            sdef = sprites[id] if 0 <= id < numSprites else None
+                            label = globals.trans.string('Sprites', 18, '[id]', id, '[name]', "UNKNOWN" if sdef is None else sdef.name)
+                            labels[id] = label
+
+                        snode.setText(0, label)
+                        snode.setData(0, UserRole, id)
 
-                    if isSearch:
-                        SearchableItems.append(snode)
+                        if isSearch:
+                            self.SearchIndex.append((label.lower(), snode))
 
                     cnode.addChild(snode)
 
                 self.addTopLevelItem(cnode)
-                cnode.setHidden(True)
                 nodelist.append(cnode)
 
-        self.ShownSearchResults = SearchableItems
+        self.ShownSearchResults = set(node for text, node in self.SearchIndex)
         self.NoSpritesFound.setHidden(True)
 
-        self.itemClicked.connect(self.HandleSprReplace)
-
+        # this sets the visibility of every category node
         self.SwitchView(globals.SpriteCategories[0])
 
     def SwitchView(self, view):
@@ -1051,13 +1187,14 @@ class SpritePickerWidget(QtWidgets.QTreeWidget):
         """
         Shows the items containing that string
         """
-        check = self.SearchResultsCategory
+        searchfor = searchfor.lower()
+        results = set(node for text, node in self.SearchIndex if searchfor in text)
 
-        rawresults = self.findItems(searchfor, Qt.MatchContains | Qt.MatchRecursive)
-        results = list(filter((lambda x: x.parent() == check), rawresults))
-
-        for x in self.ShownSearchResults: x.setHidden(True)
-        for x in results: x.setHidden(False)
+        # only toggle the items whose visibility actually changes
+        self.setUpdatesEnabled(False)
+        for x in self.ShownSearchResults - results: x.setHidden(True)
+        for x in results - self.ShownSearchResults: x.setHidden(False)
+        self.setUpdatesEnabled(True)
         self.ShownSearchResults = results
 
         self.NoSpritesFound.setHidden((len(results) != 0))
@@ -1135,7 +1272,8 @@ class SpriteEditorWidget(QtWidgets.QWidget):
         mainLayout.addLayout(toplayout)
         mainLayout.addLayout(subLayout)
 
-        layout = QtWidgets.QGridLayout()
+        layout = QtWidgets.QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
         self.editorlayout = layout
         subLayout.addLayout(layout)
         subLayout.addLayout(editboxlayout)
@@ -1155,9 +1293,13 @@ class SpriteEditorWidget(QtWidgets.QWidget):
         self.spritetype = -1
         self.data = b'\0' * 12
         self.fields = []
-        self.UpdateFlag = False
         self.DefaultMode = defaultmode
 
+        # the field widgets of every sprite type shown so far, so switching
+        # back to a type doesn't have to build them again
+        self.fieldPages = {}
+        self.fieldPage = None
+
         self.notes = None
         self.relatedObjFiles = None
 
@@ -1167,82 +1309,34 @@ class SpriteEditorWidget(QtWidgets.QWidget):
         """
         updateData = QtCore.pyqtSignal('PyQt_PyObject')
 
-        def retrieve(self, data):
+        def setBit(self, bit):
             """
-            Extracts the value from the specified bit(s). Bit numbering is ltr BE
-            and starts at 1.
+            Sets the bit(s) the decoder works on. Bit numbering is ltr BE and
+            starts at 1; a tuple is a range with an exclusive end.
             """
-            bit = self.bit
-
             if isinstance(bit, tuple):
-                if bit[1] == bit[0] + 7 and bit[0] & 1 == 1:
-                    # optimise if it's just one byte
-                    return data[bit[0] >> 3]
-
-                else:
-                    # we have to calculate it sadly
-                    # just do it by looping, shouldn't be that bad
-
-                    value = 0
-                    for n in range(bit[0], bit[1]):
-                        n -= 1
-                        value = (value << 1) | ((data[n >> 3] >> (7 - (n & 7))) & 1)
-
-                    return value
+                first, last = bit[0], bit[1] - 1
 
             else:
-                # we just want one bit
-                bit -= 1
+                first = last = bit
 
-                if (bit >> 3) >= len(data):
-                    return 0
+            # the sprite data is 96 bits long and gets packed into one int
+            self.bit = bit
+            self.shift = 96 - last
+            self.bitmask = (1 << (last - first + 1)) - 1
+            self.fieldmask = self.bitmask << self.shift
 
-                return (data[bit >> 3] >> (7 - (bit & 7))) & 1
+        def retrieve(self, data):
+            """
+            Extracts the value from the specified bit(s) of the packed data
+            """
+            return (data >> self.shift) & self.bitmask
 
         def insertvalue(self, data, value):
             """
-            Assigns a value to the specified bit(s)
+            Assigns a value to the specified bit(s) of the packed data
             """
-            bit = self.bit
-            sdata = list(data)
-
-            if isinstance(bit, tuple):
-                if bit[1] == bit[0] + 7 and bit[0] & 1 == 1:
-                    # just one byte, this is easier
-                    sdata[(bit[0] - 1) >> 3] = value & 0xFF
-
-                else:
-                    # complicated stuff
-                    for n in reversed(range(bit[0], bit[1])):
-                        off = 1 << (7 - ((n - 1) & 7))
-
-                        if value & 1:
-                            # set the bit
-                            sdata[(n - 1) >> 3] |= off
-
-                        else:
-                            # mask the bit out
-                            sdata[(n - 1) >> 3] &= 0xFF ^ off
-
-                        value >>= 1
-
-            else:
-                # only overwrite one bit
-                byte = (bit - 1) >> 3
-                if byte >= len(data):
-                    return 0
-
-                off = 1 << (7 - ((bit - 1) & 7))
-
-                if value & 1:
-                    # set the bit
-                    sdata[byte] |= off
-
-                else:
-                    # mask the bit out
-                    sdata[byte] &= 0xFF ^ off
-
-            return bytes(sdata)
+            return (data & ~self.fieldmask) | ((value & self.bitmask) << self.shift)
 
     class CheckboxPropertyDecoder(PropertyDecoder):
         """
@@ -1262,19 +1356,8 @@ class SpriteEditorWidget(QtWidgets.QWidget):
 
             self.widget.clicked.connect(self.HandleClick)
 
-            if isinstance(bit, tuple):
-                length = bit[1] - bit[0] + 1
-
-            else:
-                length = 1
-
-            xormask = 0
-            for i in range(length):
-                xormask |= 1 << i
-
-            self.bit = bit
+            self.setBit(bit)
             self.mask = mask
-            self.xormask = xormask
             layout.addWidget(self.widget, row, 0, 1, 2)
 
         def update(self, data):
@@ -1288,7 +1371,7 @@ class SpriteEditorWidget(QtWidgets.QWidget):
             """
             Assigns the selected value to the data
             """
-            value = self.retrieve(data) & (self.mask ^ self.xormask)
+            value = self.retrieve(data) & ~self.mask
 
             if self.widget.isChecked():
                 value |= self.mask
@@ -1321,7 +1404,7 @@ class SpriteEditorWidget(QtWidgets.QWidget):
 
             self.widget.currentIndexChanged.connect(self.HandleIndexChanged)
 
-            self.bit = bit
+            self.setBit(bit)
             layout.addWidget(QtWidgets.QLabel(title + ':'), row, 0, Qt.AlignRight)
             layout.addWidget(self.widget, row, 1)
 
@@ -1330,14 +1413,18 @@ class SpriteEditorWidget(QtWidgets.QWidget):
             Updates the value shown by the widget
             """
             value = self.retrieve(data)
-            if not self.model.existingLookup[value]:
-                self.widget.setCurrentIndex(-1)
-                return
+            index = -1
 
-            for i, x in enumerate(self.model.entries):
-                if x[0] == value:
-                    self.widget.setCurrentIndex(i)
-                    break
+            if self.model.existingLookup[value]:
+                for i, x in enumerate(self.model.entries):
+                    if x[0] == value:
+                        index = i
+                        break
+
+            # don't report the change back to the editor
+            self.widget.blockSignals(True)
+            self.widget.setCurrentIndex(index)
+            self.widget.blockSignals(False)
 
         def assign(self, data):
             """
@@ -1373,7 +1460,7 @@ class SpriteEditorWidget(QtWidgets.QWidget):
 
             self.widget.valueChanged.connect(self.HandleValueChanged)
 
-            self.bit = bit
+            self.setBit(bit)
             layout.addWidget(QtWidgets.QLabel(title + ':'), row, 0, Qt.AlignRight)
             layout.addWidget(self.widget, row, 1)
 
@@ -1382,7 +1469,11 @@ class SpriteEditorWidget(QtWidgets.QWidget):
             Updates the value shown by the widget
             """
             value = self.retrieve(data)
+
+            # don't report the change back to the editor
+            self.widget.blockSignals(True)
             self.widget.setValue(value)
+            self.widget.blockSignals(False)
 
         def assign(self, data):
             """
@@ -1410,6 +1501,10 @@ class SpriteEditorWidget(QtWidgets.QWidget):
             self.startbit = startbit
             self.bitnum = bitnum
 
+            # the bit of the packed data behind each checkbox
+            self.bits = [1 << (95 - startbit - i) for i in range(bitnum)]
+            self.fieldmask = sum(self.bits)
+
             self.widgets = []
 
             CheckboxLayout = QtWidgets.QGridLayout()
@@ -1439,50 +1534,22 @@ class SpriteEditorWidget(QtWidgets.QWidget):
             """
             Updates the value shown by the widget
             """
-            for bitIdx in range(self.bitnum):
-                checkbox = self.widgets[bitIdx]
-
-                adjustedIdx = bitIdx + self.startbit
-                byteNum = adjustedIdx // 8
-                bitNum = adjustedIdx % 8
-                checkbox.setChecked((data[byteNum] >> (7 - bitNum) & 1))
+            # don't report the changes back to the editor
+            for checkbox, bit in zip(self.widgets, self.bits):
+                checkbox.blockSignals(True)
+                checkbox.setChecked(bool(data & bit))
+                checkbox.blockSignals(False)
 
         def assign(self, data):
             """
             Assigns the checkbox states to the data
             """
-            data = bytearray(data)
-
-            for idx in range(self.bitnum):
-                checkbox = self.widgets[idx]
+            value = 0
+            for checkbox, bit in zip(self.widgets, self.bits):
+                if checkbox.isChecked():
+                    value |= bit
 
-                adjustedIdx = idx + self.startbit
-                byteIdx = adjustedIdx // 8
-                bitIdx = adjustedIdx % 8
-
-                origByte = data[byteIdx]
-                origBit = (origByte >> (7 - bitIdx)) & 1
-                newBit = 1 if checkbox.isChecked() else 0
-
-                if origBit == newBit:
-                    continue
-
-                if origBit == 0 and newBit == 1:
-                    # Turn the byte on by OR-ing it in
-                    newByte = (origByte | (1 << (7 - bitIdx))) & 0xFF
-
-                else:
-                    # Turn it off by:
-                    # inverting it
-                    # OR-ing in the new byte
-                    # inverting it back
-                    newByte = ~origByte & 0xFF
-                    newByte = newByte | (1 << (7 - bitIdx))
-                    newByte = ~newByte & 0xFF
-
-                data[byteIdx] = newByte
-
-            return bytes(data)
+            return (data & ~self.fieldmask) | value
 
         def HandleValueChanged(self, value):
             """
@@ -1503,15 +1570,22 @@ class SpriteEditorWidget(QtWidgets.QWidget):
         else:
             sprite = None
 
-        # remove all the existing widgets in the layout
-        layout = self.editorlayout
-        for row in range(2, layout.rowCount()):
-            for column in range(0, layout.columnCount()):
-                w = layout.itemAtPosition(row, column)
-                if w is not None:
-                    widget = w.widget()
-                    layout.removeWidget(widget)
-                    widget.setParent(None)
+        # hide the fields of the previous sprite
+        if self.fieldPage is not None:
+            self.fieldPage.setVisible(False)
+            self.fieldPage = None
+
+        if reset:
+            # the sprite definitions were reloaded, throw away the old fields
+            # (but keep the widgets shared by all of them)
+            self.activeLayer.setParent(None)
+            self.initialState.setParent(None)
+
+            for page, fields, row in self.fieldPages.values():
+                self.editorlayout.removeWidget(page)
+                page.setParent(None)
+
+            self.fieldPages = {}
 
         if sprite is None:
             self.spriteLabel.setText(globals.trans.string('SpriteDataEditor', 5, '[id]', type))
@@ -1531,57 +1605,83 @@ class SpriteEditorWidget(QtWidgets.QWidget):
             self.relatedObjFilesButton.setVisible(sprite.relatedObjFiles is not None)
             self.relatedObjFiles = sprite.relatedObjFiles
 
-            # create all the new fields
-            fields = []
-            row = 2
+            if type in self.fieldPages:
+                page, fields, row = self.fieldPages[type]
+                layout = page.layout()
+
+            else:
+                page = QtWidgets.QWidget()
+                layout = QtWidgets.QGridLayout(page)
+                layout.setContentsMargins(0, 0, 0, 0)
+
+                # create all the new fields
+                fields = []
+                row = 0
 
-            for f in sprite.fields:
-                if f[0] == 0:
-                    nf = SpriteEditorWidget.CheckboxPropertyDecoder(f[1], f[2], f[3], f[4], layout, row)
+                for f in sprite.fields:
+                    if f[0] == 0:
+                        nf = SpriteEditorWidget.CheckboxPropertyDecoder(f[1], f[2], f[3], f[4], layout, row)
 
-                elif f[0] == 1:
-                    nf = SpriteEditorWidget.ListPropertyDecoder(f[1], f[2], f[3], f[4], layout, row)
+                    elif f[0] == 1:
+                        nf = SpriteEditorWidget.ListPropertyDecoder(f[1], f[2], f[3], f[4], layout, row)
 
-                elif f[0] == 2:
-                    nf = SpriteEditorWidget.ValuePropertyDecoder(f[1], f[2], f[3], f[4], layout, row)
+                    elif f[0] == 2:
+                        nf = SpriteEditorWidget.ValuePropertyDecoder(f[1], f[2], f[3], f[4], layout, row)
 
-                elif f[0] == 3:
-                    nf = SpriteEditorWidget.BitfieldPropertyDecoder(f[1], f[2], f[3], f[4], layout, row)
+                    elif f[0] == 3:
+                        nf = SpriteEditorWidget.BitfieldPropertyDecoder(f[1], f[2], f[3], f[4], layout, row)
 
-                nf.updateData.connect(self.HandleFieldUpdate)
-                fields.append(nf)
-                row += 1
+                    nf.updateData.connect(self.HandleFieldUpdate)
+                    fields.append(nf)
+                    row += 1
+
+                layout.addWidget(createHorzLine(), row, 0, 1, 2); row += 1
+
+                layout.addWidget(QtWidgets.QLabel(globals.trans.string('SpriteDataEditor', 9)), row, 0, Qt.AlignRight)
+                layout.addWidget(QtWidgets.QLabel(globals.trans.string('SpriteDataEditor', 12)), row + 1, 0, Qt.AlignRight)
+
+                self.editorlayout.addWidget(page)
+                self.fieldPages[type] = (page, fields, row)
 
             self.fields = fields
-            layout.addWidget(createHorzLine(), row, 0, 1, 2); row += 1
 
-            layout.addWidget(QtWidgets.QLabel(globals.trans.string('SpriteDataEditor', 9)), row, 0, Qt.AlignRight)
-            layout.addWidget(self.activeLayer, row, 1); row += 1
+            # the layer and initial state boxes are shared by all sprites
+            if self.activeLayer.parentWidget() is not page:
+                layout.addWidget(self.activeLayer, row, 1)
+                layout.addWidget(self.initialState, row + 1, 1)
 
-            layout.addWidget(QtWidgets.QLabel(globals.trans.string('SpriteDataEditor', 12)), row, 0, Qt.AlignRight)
-            layout.addWidget(self.initialState, row, 1)
+            page.setVisible(True)
+            self.fieldPage = page
 
     def update(self):
         """
         Updates all the fields to display the appropriate info
         """
-        self.UpdateFlag = True
-
         data = self.data
 
-        self.raweditor.setText('%02x%02x %02x%02x %02x%02x %02x%02x %02x%02x %02x%02x' % (
-            data[0], data[1], data[2], data[3],
-            data[4], data[5], data[6], data[7],
-            data[8], data[9], data[10], data[11],
-        ))
-
-        self.raweditor.setStyleSheet('')
+        self.UpdateRawEditor(data)
 
         # Go through all the data
-        for f in self.fields:
-            f.update(data)
+        self.UpdateFields(int.from_bytes(data, 'big'), self.fields)
 
-        self.UpdateFlag = False
+    def UpdateFields(self, packed, fields):
+        """
+        Shows the packed data in the given fields, repainting only once
+        """
+        if not fields: return
+
+        self.setUpdatesEnabled(False)
+        for f in fields:
+            f.update(packed)
+        self.setUpdatesEnabled(True)
+
+    def UpdateRawEditor(self, data):
+        """
+        Shows the data in the raw editor, in groups of two bytes
+        """
+        text = data.hex()
+        self.raweditor.setText(' '.join([text[i:i + 4] for i in range(0, 24, 4)]))
+        self.raweditor.setStyleSheet('')
 
     def ShowNoteTooltip(self):
         QtWidgets.QToolTip.showText(QtGui.QCursor.pos(), self.notes, self)
@@ -1593,22 +1693,16 @@ class SpriteEditorWidget(QtWidgets.QWidget):
         """
         Triggered when a field's data is updated
         """
-        if self.UpdateFlag: return
-
-        data = field.assign(self.data)
+        oldPacked = int.from_bytes(self.data, 'big')
+        packed = field.assign(oldPacked)
+        data = packed.to_bytes(12, 'big')
         self.data = data
 
-        self.raweditor.setText('%02x%02x %02x%02x %02x%02x %02x%02x %02x%02x %02x%02x' % (
-            data[0], data[1], data[2], data[3],
-            data[4], data[5], data[6], data[7],
-            data[8], data[9], data[10], data[11],
-        ))
+        self.UpdateRawEditor(data)
 
-        self.raweditor.setStyleSheet('')
-
-        for f in self.fields:
-            if f != field:
-                f.update(data)
+        # only refresh the fields sharing bits with the one that changed
+        changed = oldPacked ^ packed
+        self.UpdateFields(packed, [f for f in self.fields if f != field and f.fieldmask & changed])
 
         self.DataUpdate.emit(data)
 
@@ -1622,7 +1716,8 @@ class SpriteEditorWidget(QtWidgets.QWidget):
 
         if len(raw) == 24:
             try:
-                data = bytes.fromhex(text)
+                # parse the stripped text, so spaces inside a byte are fine too
+                data = bytes.fromhex(raw)
                 valid = True
 
             except ValueError:
@@ -1634,14 +1729,13 @@ class SpriteEditorWidget(QtWidgets.QWidget):
             return
 
         self.raweditor.setStyleSheet('')
-        self.data = data
 
-        self.UpdateFlag = True
+        # nothing to do if only the spacing changed
+        if data == self.data: return
 
-        for f in self.fields:
-            f.update(data)
+        self.data = data
 
-        self.UpdateFlag = False
+        self.UpdateFields(int.from_bytes(data, 'big'), self.fields)
         self.DataUpdate.emit(data)
 
 class EntranceEditorWidget(QtWidgets.QWidget):
@@ -1660,12 +1754,12 @@ class EntranceEditorWidget(QtWidgets.QWidget):
         self.cameraX = QtWidgets.QSpinBox()
         self.cameraX.setRange(-32768, 32767)
         self.cameraX.setToolTip(globals.trans.string('EntranceDataEditor', 30))
-        self.cameraX.valueChanged.connect(self.HandleCameraXChanged)
+        self.cameraX.valueChanged.connect(self.HandleFieldChanged)
 
         self.cameraY = QtWidgets.QSpinBox()
         self.cameraY.setRange(-32768, 32767)
         self.cameraY.setToolTip(globals.trans.string('EntranceDataEditor', 31))
-        self.cameraY.valueChanged.connect(self.HandleCameraYChanged)
+        self.cameraY.valueChanged.connect(self.HandleFieldChanged)
 
         self.entranceID = QtWidgets.QSpinBox()
         self.entranceID.setRange(0, 255)
@@ -1685,50 +1779,50 @@ class EntranceEditorWidget(QtWidgets.QWidget):
         self.destArea = QtWidgets.QSpinBox()
         self.destArea.setRange(0, 4)
         self.destArea.setToolTip(globals.trans.string('EntranceDataEditor', 7))
-        self.destArea.valueChanged.connect(self.HandleDestAreaChanged)
+        self.destArea.valueChanged.connect(self.HandleFieldChanged)
 
         self.destEntrance = QtWidgets.QSpinBox()
         self.destEntrance.setRange(0, 255)
         self.destEntrance.setToolTip(globals.trans.string('EntranceDataEditor', 5))
-        self.destEntrance.valueChanged.connect(self.HandleDestEntranceChanged)
+        self.destEntrance.valueChanged.connect(self.HandleFieldChanged)
 
         self.allowEntryCheckbox = QtWidgets.QCheckBox(globals.trans.string('EntranceDataEditor', 8))
         self.allowEntryCheckbox.setToolTip(globals.trans.string('EntranceDataEditor', 9))
-        self.allowEntryCheckbox.clicked.connect(self.HandleAllowEntryClicked)
+        self.allowEntryCheckbox.clicked.connect(self.HandleFlagClicked)
 
         self.unkFlagCheckbox = QtWidgets.QCheckBox("Unknown Flag")
         self.unkFlagCheckbox.setToolTip("It is unknown what the purpose of this option is.")
-        self.unkFlagCheckbox.clicked.connect(self.HandleUnknownFlagClicked)
+        self.unkFlagCheckbox.clicked.connect(self.HandleFlagClicked)
 
         self.faceLeftCheckbox = QtWidgets.QCheckBox("Face left")
         self.faceLeftCheckbox.setToolTip("Makes the player face left when spawning.")
-        self.faceLeftCheckbox.clicked.connect(self.HandleFaceLeftClicked)
+        self.faceLeftCheckbox.clicked.connect(self.HandleFlagClicked)
 
         self.player1Checkbox = QtWidgets.QCheckBox("Player 1")
         self.player1Checkbox.setToolTip(globals.trans.string('EntranceDataEditor', 29))
-        self.player1Checkbox.clicked.connect(self.HandlePlayer1Clicked)
+        self.player1Checkbox.clicked.connect(self.HandleFlagClicked)
 
         self.player2Checkbox = QtWidgets.QCheckBox("Player 2")
         self.player2Checkbox.setToolTip(globals.trans.string('EntranceDataEditor', 29))
-        self.player2Checkbox.clicked.connect(self.HandlePlayer2Clicked)
+        self.player2Checkbox.clicked.connect(self.HandleFlagClicked)
 
         self.player3Checkbox = QtWidgets.QCheckBox("Player 3")
         self.player3Checkbox.setToolTip(globals.trans.string('EntranceDataEditor', 29))
-        self.player3Checkbox.clicked.connect(self.HandlePlayer3Clicked)
+        self.player3Checkbox.clicked.connect(self.HandleFlagClicked)
 
         self.player4Checkbox = QtWidgets.QCheckBox("Player 4")
         self.player4Checkbox.setToolTip(globals.trans.string('EntranceDataEditor', 29))
-        self.player4Checkbox.clicked.connect(self.HandlePlayer4Clicked)
+        self.player4Checkbox.clicked.connect(self.HandleFlagClicked)
 
         self.playerDistance = QtWidgets.QComboBox()
         self.playerDistance.addItems(["1 block", "1.5 blocks", "2 blocks"])
         self.playerDistance.setToolTip('Distance between players. Only works with entrance types 25 and 34.')
-        self.playerDistance.activated.connect(self.HandlePlayerDistanceChanged)
+        self.playerDistance.activated.connect(self.HandleFieldChanged)
 
         self.otherID = QtWidgets.QSpinBox()
         self.otherID.setRange(0, 255)
         self.otherID.setToolTip('The ID of the entrance where Baby Yoshis spawn when entering the level (or area?).\nValue of 0 makes the Baby Yoshis spawn at the same entrance.')
-        self.otherID.valueChanged.connect(self.HandleOtherID)
+        self.otherID.valueChanged.connect(self.HandleFieldChanged)
 
         self.goto = QtWidgets.QPushButton("Goto")
         self.goto.clicked.connect(self.GotoOtherEntrance)
@@ -1736,22 +1830,48 @@ class EntranceEditorWidget(QtWidgets.QWidget):
         self.coinOrder = QtWidgets.QSpinBox()
         self.coinOrder.setRange(0, 255)
         self.coinOrder.setToolTip('Used in coin edit to determine the order of entrances.\nIf there are multiple entrances with the same order, the game picks the first one it finds.')
-        self.coinOrder.valueChanged.connect(self.HandleCoinOrder)
+        self.coinOrder.valueChanged.connect(self.HandleFieldChanged)
 
         self.scrollPathID = QtWidgets.QSpinBox()
         self.scrollPathID.setRange(0, 255)
         self.scrollPathID.setToolTip('The Path ID, for autoscroll purposes.')
-        self.scrollPathID.valueChanged.connect(self.HandleScrollPathID)
+        self.scrollPathID.valueChanged.connect(self.HandleFieldChanged)
 
         self.pathnodeindex = QtWidgets.QSpinBox()
         self.pathnodeindex.setRange(0, 255)
         self.pathnodeindex.setToolTip('The Path Node Index, for autoscroll purposes.')
-        self.pathnodeindex.valueChanged.connect(self.HandlePathNodeIndex)
+        self.pathnodeindex.valueChanged.connect(self.HandleFieldChanged)
 
         self.transition = QtWidgets.QComboBox()
         self.transition.addItems(["Default", "Fade", "Mario face", "Circle towards center", "Bowser face", "Circle towards entrance", "Waves (always down)", "Waves (down on fadeout, up on fadein)", "Waves (up on fadeout, down on fadein)", "Mushroom", "Circle towards entrance", "No transition"])
         self.transition.setToolTip('The screen fades out with the transition mode of the source entrance, and fades in with the transition mode of the destination entrance.')
-        self.transition.activated.connect(self.HandleTransitionChanged)
+        self.transition.activated.connect(self.HandleFieldChanged)
+
+        # entrance attributes that are simply copied from these widgets
+        self.fieldAttrs = {
+            self.cameraX: 'camerax',
+            self.cameraY: 'cameray',
+            self.destArea: 'destarea',
+            self.destEntrance: 'destentrance',
+            self.playerDistance: 'playerDistance',
+            self.otherID: 'otherID',
+            self.coinOrder: 'coinOrder',
+            self.scrollPathID: 'pathID',
+            self.pathnodeindex: 'pathnodeindex',
+            self.transition: 'transition',
+        }
+
+        # entrance bitflags behind each checkbox: attribute, mask, and whether
+        # the checkbox is ticked when the bit is clear
+        self.flagBoxes = {
+            self.allowEntryCheckbox: ('entsettings', 0x80, True),
+            self.unkFlagCheckbox: ('entsettings', 2, False),
+            self.faceLeftCheckbox: ('entsettings', 1, False),
+            self.player1Checkbox: ('players', 1, False),
+            self.player2Checkbox: ('players', 2, False),
+            self.player3Checkbox: ('players', 4, False),
+            self.player4Checkbox: ('players', 8, False),
+        }
 
         # create a layout
         layout = QtWidgets.QGridLayout()
@@ -1842,36 +1962,11 @@ class EntranceEditorWidget(QtWidgets.QWidget):
         self.pathnodeindex.setValue(ent.pathnodeindex)
         self.transition.setCurrentIndex(ent.transition)
 
-        self.allowEntryCheckbox.setChecked(((ent.entsettings & 0x80) == 0))
-        self.unkFlagCheckbox.setChecked(((ent.entsettings & 2) != 0))
-        self.faceLeftCheckbox.setChecked(((ent.entsettings & 1) != 0))
-        self.player1Checkbox.setChecked(((ent.players & 1) != 0))
-        self.player2Checkbox.setChecked(((ent.players & 2) != 0))
-        self.player3Checkbox.setChecked(((ent.players & 4) != 0))
-        self.player4Checkbox.setChecked(((ent.players & 8) != 0))
+        for checkbox, (attr, mask, inverted) in self.flagBoxes.items():
+            checkbox.setChecked(((getattr(ent, attr) & mask) != 0) != inverted)
 
         self.UpdateFlag = False
 
-    def HandleCameraXChanged(self, i):
-        """
-        Handler for the camera x pos changing
-        """
-        if self.UpdateFlag: return
-        SetDirty()
-        self.ent.camerax = i
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandleCameraYChanged(self, i):
-        """
-        Handler for the camera y pos changing
-        """
-        if self.UpdateFlag: return
-        SetDirty()
-        self.ent.cameray = i
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
     def HandleEntranceIDChanged(self, i):
         """
         Handler for the entrance ID changing
@@ -1897,37 +1992,14 @@ class EntranceEditorWidget(QtWidgets.QWidget):
         globals.mainWindow.scene.update()
         self.ent.UpdateListItem()
 
-    def HandleDestAreaChanged(self, i):
+    @QtCore.pyqtSlot(int)
+    def HandleFieldChanged(self, i):
         """
-        Handler for the destination area changing
+        Handler for any of the plain value fields changing
         """
         if self.UpdateFlag: return
         SetDirty()
-        self.ent.destarea = i
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandleDestEntranceChanged(self, i):
-        """
-        Handler for the destination entrance changing
-        """
-        if self.UpdateFlag: return
-        SetDirty()
-        self.ent.destentrance = i
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandlePlayerDistanceChanged(self, i):
-        if self.UpdateFlag: return
-        SetDirty()
-        self.ent.playerDistance = i
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandleOtherID(self, i):
-        if self.UpdateFlag: return
-        SetDirty()
-        self.ent.otherID = i
+        setattr(self.ent, self.fieldAttrs[self.sender()], i)
         self.ent.UpdateTooltip()
         self.ent.UpdateListItem()
 
@@ -1943,122 +2015,18 @@ class EntranceEditorWidget(QtWidgets.QWidget):
             globals.mainWindow.view.centerOn(otherEnt.objx * (globals.TileWidth / 16), otherEnt.objy * (globals.TileWidth / 16))
         
 
-    def HandleCoinOrder(self, i):
-        if self.UpdateFlag: return
-        SetDirty()
-        self.ent.coinOrder = i
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandleScrollPathID(self, i):
-        if self.UpdateFlag: return
-        SetDirty()
-        self.ent.pathID = i
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandlePathNodeIndex(self, i):
-        if self.UpdateFlag: return
-        SetDirty()
-        self.ent.pathnodeindex = i
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandleTransitionChanged(self, i):
-        if self.UpdateFlag: return
-        SetDirty()
-        self.ent.transition = i
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandleAllowEntryClicked(self, checked):
-        """
-        Handle for the Allow Entry checkbox being clicked
-        """
-        if self.UpdateFlag: return
-        SetDirty()
-        if not checked:
-            self.ent.entsettings |= 0x80
-        else:
-            self.ent.entsettings &= ~0x80
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandleUnknownFlagClicked(self, checked):
+    @QtCore.pyqtSlot(bool)
+    def HandleFlagClicked(self, checked):
         """
-        Handle for the Unknown Flag checkbox being clicked
+        Handler for any of the flag checkboxes being clicked
         """
         if self.UpdateFlag: return
         SetDirty()
-        if checked:
-            self.ent.entsettings |= 2
-        else:
-            self.ent.entsettings &= ~2
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandleFaceLeftClicked(self, checked):
-        """
-        Handle for the Face Left checkbox being clicked
-        """
-        if self.UpdateFlag: return
-        SetDirty()
-        if checked:
-            self.ent.entsettings |= 1
-        else:
-            self.ent.entsettings &= ~1
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandlePlayer1Clicked(self, checked):
-        """
-        Handle for the Player 1 checkbox being clicked
-        """
-        if self.UpdateFlag: return
-        SetDirty()
-        if checked:
-            self.ent.players |= 1
-        else:
-            self.ent.players &= ~1
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandlePlayer2Clicked(self, checked):
-        """
-        Handle for the Player 2 checkbox being clicked
-        """
-        if self.UpdateFlag: return
-        SetDirty()
-        if checked:
-            self.ent.players |= 2
-        else:
-            self.ent.players &= ~2
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandlePlayer3Clicked(self, checked):
-        """
-        Handle for the Player 3 checkbox being clicked
-        """
-        if self.UpdateFlag: return
-        SetDirty()
-        if checked:
-            self.ent.players |= 4
-        else:
-            self.ent.players &= ~4
-        self.ent.UpdateTooltip()
-        self.ent.UpdateListItem()
-
-    def HandlePlayer4Clicked(self, checked):
-        """
-        Handle for the Player 4 checkbox being clicked
-        """
-        if self.UpdateFlag: return
-        SetDirty()
-        if checked:
-            self.ent.players |= 8
-        else:
-            self.ent.players &= ~8
+        attr, mask, inverted = self.flagBoxes[self.sender()]
+        value = getattr(self.ent, attr) & ~mask
+        if checked != inverted:
+            value |= mask
+        setattr(self.ent, attr, value)
         self.ent.UpdateTooltip()
         self.ent.UpdateListItem()
 
@@ -2516,38 +2484,9 @@ class LocationEditorWidget(QtWidgets.QWidget):
         SetDirty()
 
         loc = self.loc
-        left = loc.objx
-        top = loc.objy
-        right = left + loc.width
-        bottom = top + loc.height
-
-        if left % 8 < 4:
-            left -= (left % 8)
-        else:
-            left += 8 - (left % 8)
-
-        if top % 8 < 4:
-            top -= (top % 8)
-        else:
-            top += 8 - (top % 8)
-
-        if right % 8 < 4:
-            right -= (right % 8)
-        else:
-            right += 8 - (right % 8)
-
-        if bottom % 8 < 4:
-            bottom -= (bottom % 8)
-        else:
-            bottom += 8 - (bottom % 8)
-
-        if right <= left: right += 8
-        if bottom <= top: bottom += 8
-
+        left, top, loc.width, loc.height = SnapRectToGrid(loc.objx, loc.objy, loc.width, loc.height, 8)
         loc.objx = left
         loc.objy = top
-        loc.width = right - left
-        loc.height = bottom - top
 
         loc.setPos(int(left * globals.TileWidth / 16), int(top * globals.TileWidth / 16))
         loc.UpdateRects()
@@ -3830,6 +3769,9 @@ class LevelViewWidget(QtWidgets.QGraphicsView):
 
         QtWidgets.QGraphicsView.mouseReleaseEvent(self, event)
 
+        # items may have been dragged, created or resized
+        globals.mainWindow.levelOverview.update()
+
     def paintEvent(self, e):
         """
         Handles paint events and fires a signal
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+
+# Miyamoto! Level Editor - New Super Mario Bros. U Level Editor
+# Copyright (C) 2009-2021 Treeki, Tempus, angelsl, JasonP27, Kinnay,
+# MalStar1000, RoadrunnerWMC, MrRean, Grop, AboodXD, Gota7, John10v10,
+# mrbengtsson
+
+# This file is part of Miyamoto!.
+
+# Miyamoto! is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# Miyamoto! is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Miyamoto!.  If not, see <http://www.gnu.org/licenses/>.
+
+# zonesnap.py
+# Snaps zone and location coordinates to a grid
+
+
+################################################################
+################################################################
+
+# Smallest position and size a snapped zone can have
+MinZoneX, MinZoneY = 16, 16
+MinZoneWidth, MinZoneHeight = 80, 16
+
+
+def SnapRectToGrid(left, top, width, height, grid):
+    """
+    Rounds a rectangle to a grid of the given size (which must be a power of 2),
+    keeping it at least one grid cell big, and returns the new (x, y, width, height)
+    """
+    # Round to the nearest multiple of grid
+    half = grid >> 1
+    mask = ~(grid - 1)
+    right = (left + width + half) & mask
+    bottom = (top + height + half) & mask
+    left = (left + half) & mask
+    top = (top + half) & mask
+
+    return left, top, max(right, left + grid) - left, max(bottom, top + grid) - top
+
+
+def SnapZoneToGrid(left, top, width, height, grid):
+    """
+    Snaps a zone to a grid of the given size (which must be a power of 2)
+    and returns the new (x, y, width, height)
+    """
+    left, top, width, height = SnapRectToGrid(left, top, width, height, grid)
+
+    # Clamp to the valid ranges
+    upper = 0x10000 - grid
+    return (
+        min(max(left, MinZoneX), upper), min(max(top, MinZoneY), upper),
+        min(max(width, MinZoneWidth), upper), min(max(height, MinZoneHeight), upper),
+    )
@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+#cython: language_level=3
+# -*- coding: utf-8 -*-
+
+# Miyamoto! Level Editor - New Super Mario Bros. U Level Editor
+# Copyright (C) 2009-2021 Treeki, Tempus, angelsl, JasonP27, Kinnay,
+# MalStar1000, RoadrunnerWMC, MrRean, Grop, AboodXD, Gota7, John10v10,
+# mrbengtsson
+
+# This file is part of Miyamoto!.
+
+# Miyamoto! is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published by
+# the Free Software Foundation, either version 3 of the License, or
+# (at your option) any later version.
+
+# Miyamoto! is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty of
+# MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.  See the
+# GNU General Public License for more details.
+
+# You should have received a copy of the GNU General Public License
+# along with Miyamoto!.  If not, see <http://www.gnu.org/licenses/>.
+
+# zonesnap_cy.pyx
+# Snaps zone and location coordinates to a grid
+
+
+################################################################
+################################################################
+
+# Smallest position and size a snapped zone can have
+cdef int MinZoneX = 16, MinZoneY = 16
+cdef int MinZoneWidth = 80, MinZoneHeight = 16
+
+
+cdef inline (int, int, int, int) snapRect(int left, int top, int width, int height, int grid):
+    cdef:
+        int half = grid >> 1
+        int mask = ~(grid - 1)
+        int right = (left + width + half) & mask
+        int bottom = (top + height + half) & mask
+
+    # Round to the nearest multiple of grid
+    left = (left + half) & mask
+    top = (top + half) & mask
+
+    if right <= left: right = left + grid
+    if bottom <= top: bottom = top + grid
+
+    return left, top, right - left, bottom - top
+
+
+cpdef tuple SnapRectToGrid(int left, int top, int width, int height, int grid):
+    return snapRect(left, top, width, height, grid)
+
+
+cpdef tuple SnapZoneToGrid(int left, int top, int width, int height, int grid):
+    cdef int upper = 0x10000 - grid
+
+    left, top, width, height = snapRect(left, top, width, height, grid)
+
+    if left < MinZoneX: left = MinZoneX
+    if top < MinZoneY: top = MinZoneY
+    if width < MinZoneWidth: width = MinZoneWidth
+    if height < MinZoneHeight: height = MinZoneHeight
+
+    if left > upper: left = upper
+    if top > upper: top = upper
+    if width > upper: width = upper
+    if height > upper: height = upper
+
+    return left, top, width, height